@@ -1,3 +1,21 @@
+import importlib
 from .tlp_solver import TLPSolver
 from .potential_method import PotentialMethod
-from .vogels_method import VogelsMethod
\ No newline at end of file
+from .vogels_method import VogelsMethod
+
+# HiGHS pulls in scipy.optimize, so it is imported on first access (PEP 562)
+_LAZY = {
+    'HiGHSMethod': '.highs_method',
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
\ No newline at end of file
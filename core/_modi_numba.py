@@ -0,0 +1,244 @@
+import importlib.util
+import numpy as np
+from functools import lru_cache
+from types import FunctionType
+from typing import Callable, NamedTuple, Optional
+
+# numba is optional, PotentialMethod falls back to pure Python; probing for it
+# does not import it, so 'import core' pays nothing until a kernel is needed
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# status codes returned by modi_loop
+MODI_OPTIMAL = 0
+MODI_NO_CYCLE = 1
+MODI_MAX_ITERATIONS = 2
+
+
+def _modi_loop(costs, allocation, basis_mask, row_adj, row_cnt, col_adj, col_cnt,
+               max_iterations, eps):
+    """
+    MODI iterations in nopython mode, mirroring PotentialMethod step by step.
+    Adjacency is stored as padded arrays: row_adj[i, :row_cnt[i]] holds the columns
+    of basic cells in row i, col_adj[j, :col_cnt[j]] the rows of basic cells in column j.
+    Args:
+        costs: Cost matrix of shape (m, n)
+        allocation: Allocation matrix of shape (m, n), updated in place
+        basis_mask: Boolean (m, n) matrix flagging basic cells, updated in place
+        row_adj, row_cnt, col_adj, col_cnt: Basis adjacency, updated in place
+        max_iterations: Maximum number of pivots
+        eps: Numerical tolerance
+    Returns:
+        int: One of MODI_OPTIMAL, MODI_NO_CYCLE, MODI_MAX_ITERATIONS
+    """
+    m, n = costs.shape
+    u = np.empty(m)
+    v = np.empty(n)
+    queue_k = np.empty(m + n, np.int64)
+    queue_row = np.empty(m + n, np.bool_)
+
+    path_i = np.empty(2 * (m + n) + 2, np.int64)
+    path_j = np.empty(2 * (m + n) + 2, np.int64)
+    cursor = np.empty(2 * (m + n) + 2, np.int64)
+    in_path = np.zeros((m, n), np.bool_)
+
+    for _ in range(max_iterations):
+        # potentials: BFS over the basis tree from u_0 = 0
+        u[:] = np.nan
+        v[:] = np.nan
+        u[0] = 0.0
+        queue_k[0] = 0
+        queue_row[0] = True
+        head = 0
+        tail = 1
+        while head < tail:
+            k = queue_k[head]
+            is_row = queue_row[head]
+            head += 1
+            if is_row:
+                for t in range(row_cnt[k]):
+                    j = row_adj[k, t]
+                    if np.isnan(v[j]):
+                        v[j] = costs[k, j] - u[k]
+                        queue_k[tail] = j
+                        queue_row[tail] = False
+                        tail += 1
+            else:
+                for t in range(col_cnt[k]):
+                    i = col_adj[k, t]
+                    if np.isnan(u[i]):
+                        u[i] = costs[i, k] - v[k]
+                        queue_k[tail] = i
+                        queue_row[tail] = True
+                        tail += 1
+
+        # reduced costs: first minimum over non-basic cells (first NaN wins, as np.argmin)
+        best = 0
+        min_delta = np.inf
+        for idx in range(m * n):
+            i = idx // n
+            j = idx - i * n
+            if basis_mask[i, j]:
+                continue
+            delta = costs[i, j] - u[i] - v[j]
+            if np.isnan(delta):
+                best = idx
+                min_delta = delta
+                break
+            if delta < min_delta:
+                best = idx
+                min_delta = delta
+
+        if min_delta >= -eps:
+            return MODI_OPTIMAL
+
+        ei = best // n
+        ej = best - ei * n
+
+        # cycle
+        plen = _find_cycle(ei, ej, row_adj, row_cnt, col_adj, col_cnt, path_i, path_j, 
+                          cursor, in_path)
+        if plen == 0:
+            return MODI_NO_CYCLE
+
+        # theta: min allocation at '-' cells (odd positions)
+        theta = np.inf
+        for t in range(1, plen, 2):
+            theta = min(theta, allocation[path_i[t], path_j[t]])
+        if theta < eps:
+            theta = np.inf
+            for t in range(1, plen, 2):
+                value = allocation[path_i[t], path_j[t]]
+                if value > eps and value < theta:
+                    theta = value
+            if theta == np.inf:
+                theta = eps
+
+        for t in range(plen):
+            if t % 2 == 0:
+                allocation[path_i[t], path_j[t]] += theta
+            else:
+                allocation[path_i[t], path_j[t]] -= theta
+
+        # leaving cell: first '-' cell driven to zero
+        for t in range(1, plen, 2):
+            li = path_i[t]
+            lj = path_j[t]
+            if allocation[li, lj] < eps:
+                allocation[li, lj] = 0.0
+                basis_mask[li, lj] = False
+                _remove_first(row_adj[li], row_cnt, li, lj)
+                _remove_first(col_adj[lj], col_cnt, lj, li)
+                break
+
+        # entering cell
+        basis_mask[ei, ej] = True
+        row_adj[ei, row_cnt[ei]] = ej
+        row_cnt[ei] += 1
+        col_adj[ej, col_cnt[ej]] = ei
+        col_cnt[ej] += 1
+
+    return MODI_MAX_ITERATIONS
+
+
+def _find_cycle(ei, ej, row_adj, row_cnt, col_adj, col_cnt, path_i, path_j, cursor, in_path):
+    """
+    Iterative DFS for the cycle through entering cell (ei, ej); the first move is
+    horizontal and the cycle closes vertically into column ej.
+    Args:
+        ei, ej: Entering cell
+        row_adj, row_cnt, col_adj, col_cnt: Basis adjacency (see _modi_loop)
+        path_i, path_j: Output buffers of length >= 2*(m+n)+2 for the cycle cells
+        cursor: Scratch buffer of the same length, next neighbour index per path cell
+        in_path: Boolean (m, n) scratch matrix, all False on entry and on return
+    Returns:
+        int: Number of cells in path_i/path_j (entering cell first, not repeated
+        at the end), or 0 if there is no cycle
+    """
+    max_len = path_i.shape[0] - 2
+    path_i[0] = ei
+    path_j[0] = ej
+    cursor[0] = 0
+    in_path[ei, ej] = True
+    plen = 1
+    while plen > 0:
+        ci = path_i[plen - 1]
+        cj = path_j[plen - 1]
+        is_row = plen % 2 == 1
+        t = cursor[plen - 1]
+        if t >= (row_cnt[ci] if is_row else col_cnt[cj]):
+            # backtrack
+            in_path[ci, cj] = False
+            plen -= 1
+            continue
+        cursor[plen - 1] = t + 1
+        if is_row:
+            ni = ci
+            nj = row_adj[ci, t]
+            if nj == cj:
+                continue
+        else:
+            ni = col_adj[cj, t]
+            nj = cj
+            if ni == ci:
+                continue
+        if in_path[ni, nj] or plen > max_len:
+            continue
+
+        path_i[plen] = ni
+        path_j[plen] = nj
+        plen += 1
+        if plen >= 4 and plen % 2 == 0 and nj == ej:
+            for t in range(plen - 1):
+                in_path[path_i[t], path_j[t]] = False
+            return plen
+        in_path[ni, nj] = True
+        cursor[plen - 1] = 0
+    return 0
+
+
+def _remove_first(adj_row, counts, k, value):
+    """Remove the first occurrence of value from adj_row[:counts[k]], keeping order"""
+    cnt = counts[k]
+    for t in range(cnt):
+        if adj_row[t] == value:
+            for s in range(t, cnt - 1):
+                adj_row[s] = adj_row[s + 1]
+            counts[k] = cnt - 1
+            return
+
+
+class ModiKernels(NamedTuple):
+    """Compiled kernels of this module"""
+    find_cycle: Callable
+    modi_loop: Callable
+
+
+@lru_cache(maxsize=None)
+def get_kernels() -> Optional[ModiKernels]:
+    """
+    Compile the kernels on first use.
+    Explicit signatures compile eagerly, so with cache=True a fresh interpreter
+    loads the machine code from __pycache__ instead of re-running type inference.
+    Returns:
+        ModiKernels: Compiled kernels, or None if numba cannot be imported
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    remove_first = njit('void(i8[::1], i8[::1], i8, i8)', cache=True)(_remove_first)
+    find_cycle = njit(
+        'i8(i8, i8, i8[:, ::1], i8[::1], i8[:, ::1], i8[::1], i8[::1], i8[::1], i8[::1], b1[:, ::1])',
+        cache=True
+    )(_find_cycle)
+    # modi_loop resolves the helpers through its own globals, bound to the compiled
+    # ones; a closure would do the same, but numba keys the cache on closure contents
+    # and a compiled function pickles differently in every process
+    namespace = dict(globals(), _find_cycle=find_cycle, _remove_first=remove_first)
+    modi_loop = njit(
+        'i8(f8[:, ::1], f8[:, ::1], b1[:, ::1], i8[:, ::1], i8[::1], i8[:, ::1], i8[::1], i8, f8)',
+        cache=True
+    )(FunctionType(_modi_loop.__code__, namespace, _modi_loop.__name__))
+    return ModiKernels(find_cycle, modi_loop)
@@ -0,0 +1,130 @@
+import importlib.util
+import numpy as np
+from functools import lru_cache
+from typing import Callable, Optional
+
+# numba is optional, VogelsMethod falls back to NumPy; probing for it does not
+# import it, so the kernel is only compiled once VogelsMethod needs it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _vam(costs, supply, demand, skip_ratio, eps):
+    """
+    Vogel's Approximation Method in nopython mode, mirroring VogelsMethod step by step.
+    Penalties are found by a single min1/min2 scan per active row and column.
+    Args:
+        costs: Cost matrix of shape (m, n)
+        supply: Supply per supplier, consumed in place
+        demand: Demand per consumer, consumed in place
+        skip_ratio: Skip the short side penalties once one side of the active block
+            is skip_ratio times longer (Ma et al. modification), 0 to disable
+        eps: Numerical tolerance for an exhausted supply/demand
+    Returns:
+        Tuple of (values, basis_i, basis_j, count) where the first count entries
+        are the basic cells and their allocation, in allocation order
+    """
+    m, n = costs.shape
+    values = np.empty(m + n)
+    basis_i = np.empty(m + n, np.int32)
+    basis_j = np.empty(m + n, np.int32)
+    active_rows = np.ones(m, np.bool_)
+    active_cols = np.ones(n, np.bool_)
+    num_rows = m
+    num_cols = n
+    count = 0
+
+    while num_rows > 0 and num_cols > 0:
+        skip_rows = skip_ratio > 0 and num_cols >= skip_ratio * num_rows
+        skip_cols = skip_ratio > 0 and num_rows >= skip_ratio * num_cols
+
+        # row penalties: first maximum over active rows
+        max_row = 0
+        row_penalty = -np.inf
+        for i in range(m):
+            if skip_rows or not active_rows[i]:
+                continue
+            min1 = np.inf
+            min2 = np.inf
+            for j in range(n):
+                if active_cols[j]:
+                    c = costs[i, j]
+                    if c < min1:
+                        min2 = min1
+                        min1 = c
+                    elif c < min2:
+                        min2 = c
+            penalty = min1 if num_cols == 1 else min2 - min1
+            if penalty > row_penalty:
+                max_row = i
+                row_penalty = penalty
+
+        # column penalties: first maximum over active columns
+        max_col = 0
+        col_penalty = -np.inf
+        for j in range(n):
+            if skip_cols or not active_cols[j]:
+                continue
+            min1 = np.inf
+            min2 = np.inf
+            for i in range(m):
+                if active_rows[i]:
+                    c = costs[i, j]
+                    if c < min1:
+                        min2 = min1
+                        min1 = c
+                    elif c < min2:
+                        min2 = c
+            penalty = min1 if num_rows == 1 else min2 - min1
+            if penalty > col_penalty:
+                max_col = j
+                col_penalty = penalty
+
+        # select cell: cheapest active cell of the row (ties go to the row) or column
+        if row_penalty >= col_penalty:
+            i = max_row
+            j = -1
+            for t in range(n):
+                if active_cols[t] and (j < 0 or costs[i, t] < costs[i, j]):
+                    j = t
+        else:
+            j = max_col
+            i = -1
+            for t in range(m):
+                if active_rows[t] and (i < 0 or costs[t, j] < costs[i, j]):
+                    i = t
+
+        # allocate
+        amount = min(supply[i], demand[j])
+        values[count] = amount
+        basis_i[count] = i
+        basis_j[count] = j
+        count += 1
+        supply[i] -= amount
+        demand[j] -= amount
+
+        # remove exhausted row or column
+        if supply[i] < eps:
+            active_rows[i] = False
+            num_rows -= 1
+        if demand[j] < eps:
+            active_cols[j] = False
+            num_cols -= 1
+
+    return values, basis_i, basis_j, count
+
+
+@lru_cache(maxsize=None)
+def get_vam() -> Optional[Callable]:
+    """
+    Compile the VAM kernel on first use (loaded from the on-disk cache when present).
+    Returns:
+        Callable: Compiled _vam, or None if numba cannot be imported
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit('Tuple((f8[::1], i4[::1], i4[::1], i8))(f8[:, ::1], f8[::1], f8[::1], i8, f8)', 
+                cache=True)(_vam)
@@ -0,0 +1,64 @@
+import numpy as np
+from scipy.optimize import linprog
+from scipy.sparse import csr_matrix
+from utils.interfaces import ITransportationAlgorithm
+from utils import TLPProblem, TLPResult, BFSolution, SolutionStatus
+
+
+class HiGHSMethod(ITransportationAlgorithm):
+    """Transportation problem solved as a linear program by HiGHS (via SciPy)"""
+    # scipy.optimize.linprog status codes
+    LINPROG_STATUS = {
+        0: SolutionStatus.OPTIMAL,
+        2: SolutionStatus.INFEASIBLE,
+        3: SolutionStatus.UNBOUNDED,
+    }
+
+    def __init__(self, method: str = 'highs'):
+        """
+        Args:
+            method: linprog HiGHS variant ('highs', 'highs-ds' or 'highs-ipm')
+        """
+        self.method = method
+
+    def solve_from_bfs(self, problem: TLPProblem, initial_solution: BFSolution) -> TLPResult:
+        """
+        Solve transportation problem with HiGHS.
+        HiGHS builds its own starting basis, so the initial solution is not used.
+        Args:
+            problem: The transportation problem to solve
+            initial_solution: Initial basic feasible solution (ignored)
+        Returns:
+            TLPResult: The result containing optimal value and solution
+        """
+        try:
+            costs = problem.costs_np
+            m, n = costs.shape
+
+            # x[i*n + j] is shipped from supplier i to consumer j
+            cells = np.arange(m * n)
+            rows = np.concatenate([np.repeat(np.arange(m), n), m + np.tile(np.arange(n), m)])
+            a_eq = csr_matrix(
+                (np.ones(2 * m * n), (rows, np.concatenate([cells, cells]))),
+                shape=(m + n, m * n)
+            )
+            b_eq = np.concatenate([problem.supply, problem.demand])
+
+            res = linprog(costs.ravel(), A_eq=a_eq, b_eq=b_eq, bounds=(0, None), method=self.method)
+
+            status = self.LINPROG_STATUS.get(res.status, SolutionStatus.ERROR)
+            if status is not SolutionStatus.OPTIMAL:
+                return TLPResult(
+                    status=status,
+                    error_message=f"HiGHS: {res.message}"
+                )
+            return TLPResult(
+                status=SolutionStatus.OPTIMAL,
+                optimal_value=float(res.fun),
+                solution=res.x.reshape(m, n).tolist()
+            )
+        except Exception as e:
+            return TLPResult(
+                status=SolutionStatus.ERROR,
+                error_message=f"Error in HiGHS method: {str(e)}"
+            )
@@ -1,13 +1,79 @@
 import numpy as np
-from typing import List, Tuple, Set, Optional
+from collections import deque
+from typing import Callable, Dict, List, Tuple, Set, Optional, Iterator, Iterable
 from utils.interfaces import ITransportationAlgorithm
 from utils import TLPProblem, TLPResult, BFSolution, SolutionStatus
+from ._modi_numba import NUMBA_AVAILABLE, get_kernels, MODI_OPTIMAL, MODI_NO_CYCLE
+
+
+class BasisAllocation:
+    """Allocation of the basic cells only, stored as parallel arrays (bi, bj, bx)"""
+    def __init__(self, bi: Iterable[int], bj: Iterable[int], bx: Iterable[float]) -> None:
+        """
+        Args:
+            bi: Row indices of basic cells
+            bj: Column indices of basic cells (parallel to bi)
+            bx: Allocation of basic cells (parallel to bi)
+        """
+        self.bi = np.array(bi, dtype=np.intp)
+        self.bj = np.array(bj, dtype=np.intp)
+        self.bx = np.array(bx, dtype=float)
+        # slot[(i, j)] is the position of basic cell (i, j) in bi/bj/bx; sized to the basis
+        self.slot: Dict[Tuple[int, int], int] = {
+            cell: k for k, cell in enumerate(zip(self.bi.tolist(), self.bj.tolist()))
+        }
+
+    @classmethod
+    def from_bfs(cls, solution: BFSolution) -> 'BasisAllocation':
+        """Build from the sparse basic cells of a BFS, a repeated cell keeps its last value"""
+        cells = dict(zip(zip(np.asarray(solution.rows).tolist(), np.asarray(solution.cols).tolist()),
+                         np.asarray(solution.values, dtype=float).tolist()))
+        return cls([i for i, _ in cells], [j for _, j in cells], list(cells.values()))
+
+    def __len__(self) -> int:
+        return len(self.bi)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.bi.tolist(), self.bj.tolist())
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return cell in self.slot
+
+    def replace(self, slot: int, cell: Tuple[int, int], value: float) -> None:
+        """Put cell with given value into slot, dropping the cell stored there"""
+        del self.slot[int(self.bi[slot]), int(self.bj[slot])]
+        self.slot[cell] = slot
+        self.bi[slot], self.bj[slot] = cell
+        self.bx[slot] = value
+
+    def append(self, cell: Tuple[int, int], value: float) -> None:
+        """Add a new basic cell with given value"""
+        self.slot[cell] = len(self.bi)
+        self.bi = np.append(self.bi, cell[0])
+        self.bj = np.append(self.bj, cell[1])
+        self.bx = np.append(self.bx, value)
+
+    def total_cost(self, costs: np.ndarray) -> float:
+        """Transportation cost of the allocation"""
+        return float((self.bx * costs[self.bi, self.bj]).sum())
+
+    def to_dense(self, m: int, n: int) -> np.ndarray:
+        """Full (m, n) allocation matrix"""
+        dense = np.zeros((m, n), dtype=float)
+        dense[self.bi, self.bj] = self.bx
+        return dense
 
 
 class PotentialMethod(ITransportationAlgorithm):
     """Method of Potentials or MODI (Modified Distribution) Method using NumPy"""
-    def __init__(self, max_iterations: int = 1000):
+    def __init__(self, max_iterations: int = 1000, use_numba: bool = True):
+        """
+        Args:
+            max_iterations: Maximum number of pivots before giving up
+            use_numba: Run the iterations in the Numba-compiled kernel when Numba is installed
+        """
         self.max_iterations = max_iterations
+        self.use_numba = use_numba and NUMBA_AVAILABLE
         self.EPSILON = 1e-10
     
     def solve_from_bfs(self, problem: TLPProblem, initial_solution: BFSolution) -> TLPResult:
@@ -20,210 +86,502 @@ class PotentialMethod(ITransportationAlgorithm):
             TLPResult: The result containing optimal value and solution
         """
         try:
-            allocation = np.array(initial_solution.allocation, dtype=float)
-            basis = set(initial_solution.basis)
-            costs = np.array(problem.costs, dtype=float)
-            m, n = allocation.shape
+            cells = set(initial_solution.basis)
+            costs = problem.costs_np
+            m, n = initial_solution.shape
+
+            # basic cells row/column adjacency, kept in sync with basis on every pivot
+            rows_cells, cols_cells = self._build_adjacency(cells, m, n)
+            kernels = get_kernels() if self.use_numba else None
+            if kernels is not None:
+                return self._solve_numba(kernels.modi_loop, costs, initial_solution.to_dense(), 
+                                         cells, rows_cells, cols_cells)
+
+            basis = BasisAllocation.from_bfs(initial_solution)
+            # reduced costs buffer and its per-row minima, reused across iterations
+            deltas = np.empty((m, n), dtype=float)
+            row_min = np.empty(m, dtype=float)
+            row_arg = None
+            u = v = moved = None
 
             for _ in range(self.max_iterations):
-                # calc potentials
-                u, v = self._calculate_potentials(costs, basis, m, n)
-                # calc reduced costs
-                deltas = costs - u[:, None] - v[None, :]
-                
-                non_basic_mask = np.array([
-                    [(i, j) not in basis for j in range(n)] 
-                    for i in range(m)
-                ])
-                deltas_masked = np.where(non_basic_mask, deltas, np.inf)
+                # calc potentials: after a pivot only the subtree cut off by the
+                # leaving cell is shifted, otherwise solve from scratch
+                if moved is None:
+                    u, v = self._calculate_potentials(costs, rows_cells, cols_cells)
+                # calc reduced costs (basic cells excluded)
+                if moved is not None and 2 * (moved[0].size + moved[1].size) < m + n:
+                    self._update_reduced_costs(
+                        costs, u, v, moved[0], moved[1], basis.bi, basis.bj,
+                        deltas, row_min, row_arg
+                    )
+                else:
+                    np.subtract(costs, u[:, None], out=deltas)
+                    deltas -= v[None, :]
+                    deltas[basis.bi, basis.bj] = np.inf
+                    np.min(deltas, axis=1, out=row_min)
+                    # row_arg is only needed once an improving cell exists
+                    row_arg = None
                 
                 # optimal condition
-                min_delta = np.min(deltas_masked)
+                i = int(row_min.argmin())
+                min_delta = row_min[i]
                 if min_delta >= -self.EPSILON:
-                    total_cost = float(np.sum(allocation * costs))
                     return TLPResult(
-                        status=SolutionStatus.OPTIMAL.value,
-                        optimal_value=total_cost,
-                        solution=allocation.tolist()
+                        status=SolutionStatus.OPTIMAL,
+                        optimal_value=basis.total_cost(costs),
+                        solution=basis.to_dense(m, n).tolist()
                     )
+                if row_arg is None:
+                    row_arg = deltas.argmin(axis=1)
                 
-                entering_cell = tuple(np.unravel_index(
-                    np.argmin(deltas_masked), 
-                    deltas_masked.shape
-                ))
-                # cycle
-                cycle = self._find_cycle(entering_cell, basis, m, n)
-                if not cycle:
+                # cycle and pivot
+                found, moved = self._pivot(costs, basis, rows_cells, cols_cells, u, v, 
+                                           (i, int(row_arg[i])))
+                if not found:
                     return TLPResult(
-                        status=SolutionStatus.ERROR.value,
+                        status=SolutionStatus.ERROR,
                         error_message="Could not find cycle for improvement"
                     )
-                # update solution
-                allocation, basis = self._update_solution(allocation, basis, cycle)
 
             # max iterations reached
             return TLPResult(
-                status=SolutionStatus.ERROR.value,
+                status=SolutionStatus.ERROR,
                 error_message=f"Max iterations ({self.max_iterations}) reached"
             )
         except Exception as e:
             return TLPResult(
-                status=SolutionStatus.ERROR.value,
+                status=SolutionStatus.ERROR,
                 error_message=f"Error in MODI method: {str(e)}"
             )
 
-    def _calculate_potentials(self, costs: np.ndarray, basis: Set[Tuple[int, int]], 
-                              m: int, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    def solve_batch_from_bfs(self, problems: List[TLPProblem], 
+                             initial_solutions: List[BFSolution]) -> List[TLPResult]:
         """
-        Calculate potentials u_i and v_j for basic variables.
-        For basic cells: u_i + v_j = c_ij
+        Solve problems of equal shape in lockstep: reduced costs of the whole
+        batch come from one (B, m, n) broadcast into a reused buffer, while
+        potentials, cycles and pivots stay per problem. Each problem follows the
+        same pivots as solve_from_bfs, and an error only ends its own problem.
+        Args:
+            problems: The transportation problems to solve
+            initial_solutions: Initial basic feasible solution per problem
+        Returns:
+            List[TLPResult]: The result per problem, in input order
+        """
+        if self.use_numba or len(problems) < 2:
+            return super().solve_batch_from_bfs(problems, initial_solutions)
+
+        costs = np.stack([problem.costs_np for problem in problems])
+        batch_size, m, n = costs.shape
+        results = [None] * batch_size
+
+        # per problem: basic allocation and adjacency, kept in sync on every pivot
+        states = [None] * batch_size
+        for b, initial_solution in enumerate(initial_solutions):
+            try:
+                rows_cells, cols_cells = self._build_adjacency(set(initial_solution.basis), m, n)
+                states[b] = (BasisAllocation.from_bfs(initial_solution), rows_cells, cols_cells)
+            except Exception as e:
+                results[b] = TLPResult(
+                    status=SolutionStatus.ERROR,
+                    error_message=f"Error in MODI method: {str(e)}"
+                )
+        # potentials and reduced costs buffer, reused across iterations
+        u = np.empty((batch_size, m), dtype=float)
+        v = np.empty((batch_size, n), dtype=float)
+        deltas = np.empty((batch_size, m, n), dtype=float)
+        moved = [None] * batch_size
+        active = [b for b in range(batch_size) if results[b] is None]
+        active_costs = costs[active]
+
+        for _ in range(self.max_iterations):
+            # calc potentials of problems that could not shift them after the last pivot
+            still_active = []
+            for b in active:
+                if moved[b] is None:
+                    _, rows_cells, cols_cells = states[b]
+                    try:
+                        u[b], v[b] = self._calculate_potentials(costs[b], rows_cells, cols_cells)
+                    except Exception as e:
+                        results[b] = TLPResult(
+                            status=SolutionStatus.ERROR,
+                            error_message=f"Error in MODI method: {str(e)}"
+                        )
+                        continue
+                still_active.append(b)
+            if len(still_active) != len(active):
+                active = still_active
+                active_costs = costs[active]
+                if not active:
+                    break
+
+            # calc reduced costs of the whole batch (basic cells excluded)
+            batch_deltas = deltas[:len(active)]
+            np.subtract(active_costs, u[active, :, None], out=batch_deltas)
+            batch_deltas -= v[active, None, :]
+            for k, b in enumerate(active):
+                batch_deltas[k, states[b][0].bi, states[b][0].bj] = np.inf
+            # optimal condition of the whole batch
+            flat = batch_deltas.reshape(len(active), -1)
+            best = flat.argmin(axis=1)
+            min_deltas = flat[np.arange(len(active)), best]
+
+            still_active = []
+            for b, idx, min_delta in zip(active, best.tolist(), min_deltas.tolist()):
+                basis, rows_cells, cols_cells = states[b]
+                try:
+                    if min_delta >= -self.EPSILON:
+                        results[b] = TLPResult(
+                            status=SolutionStatus.OPTIMAL,
+                            optimal_value=basis.total_cost(costs[b]),
+                            solution=basis.to_dense(m, n).tolist()
+                        )
+                        continue
+                    # cycle and pivot
+                    found, moved[b] = self._pivot(costs[b], basis, rows_cells, cols_cells, 
+                                                  u[b], v[b], divmod(idx, n))
+                    if not found:
+                        results[b] = TLPResult(
+                            status=SolutionStatus.ERROR,
+                            error_message="Could not find cycle for improvement"
+                        )
+                        continue
+                    still_active.append(b)
+                except Exception as e:
+                    results[b] = TLPResult(
+                        status=SolutionStatus.ERROR,
+                        error_message=f"Error in MODI method: {str(e)}"
+                    )
+            if len(still_active) != len(active):
+                active = still_active
+                active_costs = costs[active]
+            if not active:
+                break
+
+        # max iterations reached
+        for b in active:
+            results[b] = TLPResult(
+                status=SolutionStatus.ERROR,
+                error_message=f"Max iterations ({self.max_iterations}) reached"
+            )
+        return results
+
+    def _pivot(self, costs: np.ndarray, basis: BasisAllocation, rows_cells: List[List[int]], 
+               cols_cells: List[List[int]], u: np.ndarray, v: np.ndarray, 
+               entering_cell: Tuple[int, int]) -> Tuple[bool, Optional[Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Bring a cell into the basis along its cycle. Potentials are shifted only
+        while the basis is a spanning tree, anything else is solved from scratch.
+        Args:
+            costs: Cost matrix of shape (m, n)
+            basis: Current basic cells and their allocation, updated in place
+            rows_cells: Columns of basic cells per row, updated in place
+            cols_cells: Rows of basic cells per column, updated in place
+            u: Supplier potentials, updated in place
+            v: Consumer potentials, updated in place
+            entering_cell: Cell to enter basis (i, j)
+        Returns:
+            Tuple of (found, moved) where found tells whether a cycle exists and moved
+            holds the (rows, cols) whose potentials were shifted, or None if the
+            potentials have to be recalculated
+        """
+        cycle = self._find_cycle(entering_cell, rows_cells, cols_cells)
+        if cycle is None:
+            return False, None
+        m, n = costs.shape
+        basis_size = len(basis)
+        self._update_solution(basis, rows_cells, cols_cells, cycle)
+        if (len(basis) == basis_size == m + n - 1
+                and not (np.isnan(u).any() or np.isnan(v).any())):
+            return True, self._shift_potentials(costs, u, v, entering_cell, rows_cells, cols_cells)
+        return True, None
+
+    def _solve_numba(self, modi_loop: Callable, costs: np.ndarray, allocation: np.ndarray, 
+                     basis: Set[Tuple[int, int]], rows_cells: List[List[int]], 
+                     cols_cells: List[List[int]]) -> TLPResult:
+        """
+        Run the MODI iterations in the Numba-compiled kernel.
+        Args:
+            modi_loop: Compiled kernel (see _modi_numba.get_kernels)
+            costs: Cost matrix of shape (m, n)
+            allocation: Initial allocation matrix, updated in place
+            basis: Initial basic variables
+            rows_cells: Columns of basic cells per row
+            cols_cells: Rows of basic cells per column
+        Returns:
+            TLPResult: The result containing optimal value and solution
+        """
+        m, n = allocation.shape
+        basis_mask = np.zeros((m, n), dtype=bool)
+        row_adj = np.zeros((m, n), dtype=np.int64)
+        col_adj = np.zeros((n, m), dtype=np.int64)
+        row_cnt = np.array([len(cells) for cells in rows_cells], dtype=np.int64)
+        col_cnt = np.array([len(cells) for cells in cols_cells], dtype=np.int64)
+        for i, cells in enumerate(rows_cells):
+            row_adj[i, :len(cells)] = cells
+        for j, cells in enumerate(cols_cells):
+            col_adj[j, :len(cells)] = cells
+        for i, j in basis:
+            basis_mask[i, j] = True
+
+        status = modi_loop(costs, allocation, basis_mask, row_adj, row_cnt, col_adj, col_cnt,
+                           self.max_iterations, self.EPSILON)
+        if status == MODI_OPTIMAL:
+            return TLPResult(
+                status=SolutionStatus.OPTIMAL,
+                optimal_value=float(np.sum(allocation * costs)),
+                solution=allocation.tolist()
+            )
+        if status == MODI_NO_CYCLE:
+            return TLPResult(
+                status=SolutionStatus.ERROR,
+                error_message="Could not find cycle for improvement"
+            )
+        return TLPResult(
+            status=SolutionStatus.ERROR,
+            error_message=f"Max iterations ({self.max_iterations}) reached"
+        )
+
+    @staticmethod
+    def _update_reduced_costs(costs: np.ndarray, u: np.ndarray, v: np.ndarray, 
+                              rows: np.ndarray, cols: np.ndarray, bi: np.ndarray, bj: np.ndarray,
+                              deltas: np.ndarray, row_min: np.ndarray, row_arg: np.ndarray) -> None:
+        """
+        Refresh reduced costs and their per-row minima after the potentials of
+        some rows and columns changed. Every other row keeps its cached minimum,
+        patched with the refreshed columns.
         Args:
             costs: Cost matrix of shape (m, n)
+            u: Supplier potentials
+            v: Consumer potentials
+            rows: Rows whose potential changed
+            cols: Columns whose potential changed
+            bi: Row indices of basic cells
+            bj: Column indices of basic cells (parallel to bi)
+            deltas: Reduced costs matrix, updated in place
+            row_min: Minimum reduced cost per row, updated in place
+            row_arg: Column of the first minimum per row, updated in place
+        """
+        if rows.size:
+            deltas[rows] = costs[rows] - u[rows, None] - v[None, :]
+        if cols.size:
+            deltas[:, cols] = costs[:, cols] - u[:, None] - v[None, cols]
+        deltas[bi, bj] = np.inf
+
+        if cols.size:
+            sub = deltas[:, cols]
+            sub_min = sub.min(axis=1)
+            sub_col = cols[sub.argmin(axis=1)]
+            # a cached minimum that sat in a refreshed column may have gone up
+            moved = np.zeros(deltas.shape[1], dtype=bool)
+            moved[cols] = True
+            stale = moved[row_arg]
+            better = (sub_min < row_min) | ((sub_min == row_min) & (sub_col < row_arg))
+            np.copyto(row_min, sub_min, where=better)
+            np.copyto(row_arg, sub_col, where=better)
+            rows = np.concatenate((rows, np.flatnonzero(stale & ~better)))
+
+        if rows.size:
+            sub = deltas[rows]
+            row_min[rows] = sub.min(axis=1)
+            row_arg[rows] = sub.argmin(axis=1)
+
+    @staticmethod
+    def _build_adjacency(basis: Set[Tuple[int, int]], m: int, 
+                         n: int) -> Tuple[List[List[int]], List[List[int]]]:
+        """
+        Build per-row and per-column lists of basic cells.
+        Args:
             basis: Set of basic variables (i, j)
             m: Number of suppliers
             n: Number of consumers
+        Returns:
+            Tuple of (rows_cells, cols_cells) where rows_cells[i] holds the columns
+            of basic cells in row i and cols_cells[j] the rows of basic cells in column j
+        """
+        rows_cells = [[] for _ in range(m)]
+        cols_cells = [[] for _ in range(n)]
+        for i, j in basis:
+            rows_cells[i].append(j)
+            cols_cells[j].append(i)
+        return rows_cells, cols_cells
+
+    def _calculate_potentials(self, costs: np.ndarray, rows_cells: List[List[int]], 
+                              cols_cells: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate potentials u_i and v_j for basic variables.
+        For basic cells: u_i + v_j = c_ij, solved by a single traversal
+        of the basis tree starting from u_0 = 0
+        Args:
+            costs: Cost matrix of shape (m, n)
+            rows_cells: Columns of basic cells per row
+            cols_cells: Rows of basic cells per column
         Returns:
             Tuple of (u, v) where u[i] and v[j] are potentials
         """
-        u = np.full(m, np.nan, dtype=float)
-        v = np.full(n, np.nan, dtype=float)
+        u = np.full(len(rows_cells), np.nan, dtype=float)
+        v = np.full(len(cols_cells), np.nan, dtype=float)
 
         u[0] = 0.0 # basis solution
 
-        updated = True
-        max_iter = m + n
-        iter_count = 0
-        
-        while updated and iter_count < max_iter:
-            updated = False
-            iter_count += 1
-            
-            for i, j in basis:
-                if np.isnan(u[i]) and not np.isnan(v[j]):
-                    u[i] = costs[i, j] - v[j]
-                    updated = True
-                elif np.isnan(v[j]) and not np.isnan(u[i]):
-                    v[j] = costs[i, j] - u[i]
-                    updated = True
+        # BFS over the basis spanning tree (rows and columns are the nodes)
+        queue = deque([(0, True)])
+        while queue:
+            k, is_row = queue.popleft()
+            if is_row:
+                for j in rows_cells[k]:
+                    if np.isnan(v[j]):
+                        v[j] = costs[k, j] - u[k]
+                        queue.append((j, False))
+            else:
+                for i in cols_cells[k]:
+                    if np.isnan(u[i]):
+                        u[i] = costs[i, k] - v[k]
+                        queue.append((i, True))
 
         return u, v
 
-    def _find_cycle(self, entering_cell: Tuple[int, int], basis: Set[Tuple[int, int]], 
-                    m: int, n: int) -> Optional[List[Tuple[int, int]]]:
+    @staticmethod
+    def _shift_potentials(costs: np.ndarray, u: np.ndarray, v: np.ndarray, 
+                          entering_cell: Tuple[int, int], rows_cells: List[List[int]],
+                          cols_cells: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Find closed cycle starting and ending at entering cell.
-        Cycle alternates between horizontal and vertical moves.
+        Update potentials after a pivot without solving them from scratch.
+        Cutting the entering edge splits the new basis tree in two; the smaller
+        part is shifted so that u_i + v_j = c_ij holds on the entering cell.
+        Potentials are only defined up to a constant, so u_0 may drift from 0.
         Args:
-            entering_cell: Cell to enter basis (i, j)
-            basis: Current basic variables
-            m: Number of suppliers
-            n: Number of consumers
+            costs: Cost matrix of shape (m, n)
+            u: Supplier potentials before the pivot, updated in place
+            v: Consumer potentials before the pivot, updated in place
+            entering_cell: Cell that entered the basis (i, j)
+            rows_cells: Columns of basic cells per row (after the pivot)
+            cols_cells: Rows of basic cells per column (after the pivot)
         Returns:
-            List of cells in cycle, or None if not found
+            Tuple of (rows, cols) whose potentials changed
         """
-        def dfs(curr: Tuple[int, int], target: Tuple[int, int], path: List[Tuple[int, int]], 
-            visited: Set[Tuple[int, int]], is_row: bool) -> Optional[List[Tuple[int, int]]]:
-            """DFS to find cycle"""
-            if len(path) >= 4:
-                i, j = curr
+        ei, ej = entering_cell
+        # BFS queues of (node, is_row, parent) on both sides of the entering edge,
+        # grown in lockstep until one side is exhausted
+        queues = ([(ei, True, ej)], [(ej, False, ei)])
+        heads = [0, 0]
+        while heads[0] < len(queues[0]) and heads[1] < len(queues[1]):
+            for side in (0, 1):
+                k, is_row, parent = queues[side][heads[side]]
+                heads[side] += 1
                 if is_row:
-                    if i == target[0] and target[1] in rows_cells.get(i, []):
-                        return path
+                    queues[side].extend((j, False, k) for j in rows_cells[k] if j != parent)
                 else:
-                    if j == target[1] and target[0] in cols_cells.get(j, []):
-                        return path
-            
-            if curr in visited:
-                return None
-            if len(path) > 2 * (m + n):
-                return None
-
-            visited.add(curr)
-            i, j = curr
-            
-            if is_row:
-                for next_j in rows_cells.get(i, []):
-                    if next_j == j:
-                        continue
-                    next_cell = (i, next_j)
-                    new_path = path + [next_cell]
-                    result = dfs(next_cell, target, new_path, visited.copy(), False)
-                    if result:
-                        return result
-            else:
-                for next_i in cols_cells.get(j, []):
-                    if next_i == i:
-                        continue
-                    next_cell = (next_i, j)
-                    new_path = path + [next_cell]
-                    result = dfs(next_cell, target, new_path, visited.copy(), True)
-                    if result:
-                        return result
-            
-            return None
+                    queues[side].extend((i, True, k) for i in cols_cells[k] if i != parent)
+        side = 0 if heads[0] == len(queues[0]) else 1
+
+        nodes = queues[side]
+        rows = np.sort(np.fromiter((k for k, is_row, _ in nodes if is_row), dtype=np.intp))
+        cols = np.sort(np.fromiter((k for k, is_row, _ in nodes if not is_row), dtype=np.intp))
+        shift = costs[ei, ej] - u[ei] - v[ej]
+        if side == 1:
+            shift = -shift  # column side: v_j rises instead of u_i
+        u[rows] += shift
+        v[cols] -= shift
+        return rows, cols
 
+    def _find_cycle(self, entering_cell: Tuple[int, int], rows_cells: List[List[int]], 
+                    cols_cells: List[List[int]]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Find closed cycle starting and ending at entering cell.
+        Cycle alternates between horizontal and vertical moves.
+        Args:
+            entering_cell: Cell to enter basis (i, j)
+            rows_cells: Columns of basic cells per row
+            cols_cells: Rows of basic cells per column
+        Returns:
+            Row and column indices (ci, cj) of the cycle cells as int32 arrays,
+            or None if not found
+        """
         i0, j0 = entering_cell
-        
-        # adj lists
-        rows_cells = {i: [] for i in range(m)}
-        cols_cells = {j: [] for j in range(n)}
 
-        for i, j in basis:
-            rows_cells[i].append(j)
-            cols_cells[j].append(i)
+        # iterative DFS: one iterator over the next row/column index per path cell,
+        # first move is horizontal
+        path_i = [i0]
+        path_j = [j0]
+        in_path = {entering_cell}
+        stack = [iter(rows_cells[i0])]
+        max_len = 2 * (len(rows_cells) + len(cols_cells))
 
-        rows_cells[i0].append(j0)
-        cols_cells[j0].append(i0)
+        while stack:
+            k = next(stack[-1], None)
+            if k is None:
+                # backtrack
+                stack.pop()
+                in_path.discard((path_i.pop(), path_j.pop()))
+                continue
+            i, j = path_i[-1], path_j[-1]
+            # odd path length: horizontal move to column k, even: vertical move to row k
+            horizontal = len(path_i) % 2 == 1
+            next_cell = (i, k) if horizontal else (k, j)
+            if k == (j if horizontal else i) or next_cell in in_path or len(path_i) > max_len:
+                continue
 
-        cycle = dfs(entering_cell, entering_cell, [entering_cell], set(), True)
-        if cycle: # close a cycle
-            cycle.append(entering_cell)
-        
-        return cycle
+            path_i.append(next_cell[0])
+            path_j.append(next_cell[1])
+            # after a horizontal move the cycle closes vertically into the entering column
+            if len(path_i) >= 4 and len(path_i) % 2 == 0 and next_cell[1] == j0:
+                path_i.append(i0) # close a cycle
+                path_j.append(j0)
+                return np.asarray(path_i, dtype=np.int32), np.asarray(path_j, dtype=np.int32)
+
+            in_path.add(next_cell)
+            # a horizontal move is followed by a vertical one and vice versa
+            stack.append(iter(cols_cells[next_cell[1]] if horizontal else rows_cells[next_cell[0]]))
 
-    def _update_solution(self, allocation: np.ndarray, basis: Set[Tuple[int, int]], 
-                         cycle: List[Tuple[int, int]]) -> Tuple[np.ndarray, Set[Tuple[int, int]]]:
+        return None
+
+    def _update_solution(self, basis: BasisAllocation, rows_cells: List[List[int]], 
+                         cols_cells: List[List[int]], 
+                         cycle: Tuple[np.ndarray, np.ndarray]) -> BasisAllocation:
         """
         Update allocation along the cycle.
         Add to '+' cells (even positions), subtract from '-' cells (odd positions).
         Args:
-            allocation: Current allocation matrix
-            basis: Current basic variables
-            cycle: Cycle of cells (starting with entering cell)
+            basis: Current basic cells and their allocation, updated in place
+            rows_cells: Columns of basic cells per row, updated in place
+            cols_cells: Rows of basic cells per column, updated in place
+            cycle: Row and column indices (ci, cj) of the cycle (starting with entering cell)
         Returns:
-            Updated (allocation, basis)
+            BasisAllocation: Updated basis
         """
-        if len(cycle) > 1 and cycle[0] == cycle[-1]:
-            cycle = cycle[:-1]
+        ci, cj = cycle
+        if len(ci) > 1 and ci[0] == ci[-1] and cj[0] == cj[-1]:
+            ci, cj = ci[:-1], cj[:-1]
         
-        # add indicies of '-'
-        minus_positions = cycle[1::2]
+        # slots of the basic cells on the cycle, entering cell excluded
+        slot = basis.slot
+        cells = zip(ci[1:].tolist(), cj[1:].tolist())
+        slots = np.fromiter((slot[cell] for cell in cells), dtype=np.intp, count=len(ci) - 1)
+        plus_slots, minus_slots = slots[1::2], slots[0::2]
 
         # min allocation at '-' cells
-        theta = min(allocation[i, j] for i, j in minus_positions)
+        minus_values = basis.bx[minus_slots]
+        theta = minus_values.min()
         if theta < self.EPSILON:
-            positive_values = [allocation[i, j] for i, j in minus_positions 
-                             if allocation[i, j] > self.EPSILON]
-            theta = min(positive_values) if positive_values else self.EPSILON
-
-        for idx, (i, j) in enumerate(cycle):
-            if idx % 2 == 0:    # '+' cells
-                allocation[i, j] += theta
-            else:               # '-' cells
-                allocation[i, j] -= theta
-
-        # leaving cell
-        leaving_cell = None
-        for i, j in minus_positions:
-            if allocation[i, j] < self.EPSILON:
-                leaving_cell = (i, j)
-                allocation[i, j] = 0
-                break
+            positive_values = minus_values[minus_values > self.EPSILON]
+            theta = positive_values.min() if positive_values.size else self.EPSILON
+
+        basis.bx[plus_slots] += theta     # '+' cells
+        basis.bx[minus_slots] -= theta    # '-' cells
 
-        # update basis
-        new_basis = basis.copy()
-        if leaving_cell:
-            new_basis.remove(leaving_cell)
-        new_basis.add(cycle[0])  # entering cell
+        # leaving cell: first '-' cell driven to zero, entering cell takes over its slot
+        ei, ej = int(ci[0]), int(cj[0])
+        emptied = np.flatnonzero(basis.bx[minus_slots] < self.EPSILON)
+        if emptied.size:
+            leaving = minus_slots[emptied[0]]
+            li, lj = int(basis.bi[leaving]), int(basis.bj[leaving])
+            rows_cells[li].remove(lj)
+            cols_cells[lj].remove(li)
+            basis.replace(leaving, (ei, ej), theta)
+        else:
+            basis.append((ei, ej), theta)
+        rows_cells[ei].append(ej)
+        cols_cells[ej].append(ei)
 
-        return allocation, new_basis
\ No newline at end of file
+        return basis
\ No newline at end of file
@@ -1,3 +1,5 @@
+import numpy as np
+from typing import List
 from utils.interfaces import IBFSFinder, ITransportationAlgorithm
 from utils import (
     TLPProblem, TLPResult, SolutionStatus
@@ -13,6 +15,7 @@ class TLPSolver:
         """
         self.bfs_finder = bfs_finder
         self.algorithm = algorithm
+        self._padded_buffer = None  # padded costs of the last balanced problem, reused by solve
 
     def solve(self, problem: TLPProblem) -> TLPResult:
         """
@@ -24,12 +27,12 @@ class TLPSolver:
         """
         try:
             if not problem.is_balanced():
-                problem = self._balance_problem(problem)
+                problem = self._balance_problem(problem, reuse_buffer=True)
             # initial basic feasible solution
             initial_solution = self.bfs_finder.find_initial_bfs(problem)
             if not initial_solution:
                 return TLPResult(
-                    status=SolutionStatus.INFEASIBLE.value,
+                    status=SolutionStatus.INFEASIBLE,
                     error_message="No initial BFS found"
                 )
             # optimize
@@ -37,38 +40,82 @@ class TLPSolver:
             return final_result
         except Exception as e:
             return TLPResult(
-                status=SolutionStatus.ERROR.value,
+                status=SolutionStatus.ERROR,
                 error_message=f"Solver error: {str(e)}"
             )
         
-    def _balance_problem(self, problem: TLPProblem) -> TLPProblem:
+    def solve_batch(self, problems: List[TLPProblem]) -> List[TLPResult]:
+        """
+        Solve several independent transportation LP problems.
+        Problems of equal (balanced) shape are optimized together, so the algorithm
+        can share vectorized work across them.
+        Args:
+            problems (List[TLPProblem]): The transportation LP problems to solve
+        Returns:
+            List[TLPResult]: The solution per problem, in input order
+        """
+        results = [None] * len(problems)
+        groups = {}  # shape -> [(index, balanced problem, initial solution)]
+        for k, problem in enumerate(problems):
+            try:
+                if not problem.is_balanced():
+                    problem = self._balance_problem(problem)
+                initial_solution = self.bfs_finder.find_initial_bfs(problem)
+                if not initial_solution:
+                    results[k] = TLPResult(
+                        status=SolutionStatus.INFEASIBLE,
+                        error_message="No initial BFS found"
+                    )
+                    continue
+                groups.setdefault(problem.costs_np.shape, []).append((k, problem, initial_solution))
+            except Exception as e:
+                results[k] = TLPResult(
+                    status=SolutionStatus.ERROR,
+                    error_message=f"Solver error: {str(e)}"
+                )
+
+        for group in groups.values():
+            indices, group_problems, initial_solutions = zip(*group)
+            try:
+                group_results = self.algorithm.solve_batch_from_bfs(
+                    list(group_problems), list(initial_solutions)
+                )
+            except Exception as e:
+                # one result object per problem, callers may mutate theirs
+                group_results = [
+                    TLPResult(
+                        status=SolutionStatus.ERROR,
+                        error_message=f"Solver error: {str(e)}"
+                    )
+                    for _ in indices
+                ]
+            for k, result in zip(indices, group_results):
+                results[k] = result
+        return results
+
+    def _balance_problem(self, problem: TLPProblem, reuse_buffer: bool = False) -> TLPProblem:
         """
         Balance transportation LP problem
         Args:
             problem (TLPProblem): The transportation LP problem
+            reuse_buffer (bool): Write padded costs into the solver's buffer instead of
+                a new array; the result is only valid until the next call
         Returns:
             TLPProblem: Balanced transportation LP problem
         """
         total_supply = problem.total_supply
         total_demand = problem.total_demand
         
+        buffer = None
+        if reuse_buffer:
+            m, n = problem.costs_np.shape
+            if self._padded_buffer is None or self._padded_buffer.size < (m + 1) * (n + 1):
+                self._padded_buffer = np.empty((m + 1) * (n + 1), dtype=np.float64)
+            buffer = self._padded_buffer
+
         if total_supply > total_demand:
             # dummy consumer
-            deficit = total_supply - total_demand
-            new_demand = problem.demand + [deficit]
-            new_costs = [row + [0.0] for row in problem.costs]
-            return TLPProblem(
-                supply=problem.supply.copy(),
-                demand=new_demand,
-                costs=new_costs
-            )
+            return problem.padded_view(False, True, total_supply - total_demand, buffer)
         else:
             # dummy supplier
-            deficit = total_demand - total_supply
-            new_supply = problem.supply + [deficit]
-            new_costs = problem.costs + [[0.0] * problem.num_consumers]
-            return TLPProblem(
-                supply=new_supply,
-                demand=problem.demand.copy(),
-                costs=new_costs
-            )
\ No newline at end of file
+            return problem.padded_view(True, False, total_demand - total_supply, buffer)
\ No newline at end of file
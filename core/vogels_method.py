@@ -1,10 +1,30 @@
 from utils.interfaces import IBFSFinder
 from utils import TLPProblem, BFSolution
+from ._vogel_numba import NUMBA_AVAILABLE, get_vam
 import numpy as np
+from typing import Callable
 
 class VogelsMethod(IBFSFinder):
-    """Vogel's Approximation Method (VAM)"""
+    """
+    Vogel's Approximation Method (VAM)
+    With the Ma et al. modification, penalties of the short side of a skewed active
+    block (one side at least SKIP_MINOR_PENALTY_RATIO times longer) are not computed:
+    such a penalty rarely decides the pick, so the saved sweep per allocation costs
+    little in initial solution quality, but the BFS may differ from plain VAM.
+    """
     EPSILON=1e-10
+    SKIP_MINOR_PENALTY_RATIO = 4
+    SORT_MAX_COLS = 8   # full sort of short rows beats np.partition's constant overhead
+    def __init__(self, use_numba: bool = True, use_ma_modification: bool = True):
+        """
+        Args:
+            use_numba: Run VAM in the Numba-compiled kernel when Numba is installed
+            use_ma_modification: Skip the short side penalties of skewed problems
+                (set False for strict VAM)
+        """
+        self.use_numba = use_numba and NUMBA_AVAILABLE
+        self.use_ma_modification = use_ma_modification
+
     def find_initial_bfs(self, problem: TLPProblem):
         """
         Computes an initial basic feasible solution for transportation problems
@@ -14,41 +34,53 @@ class VogelsMethod(IBFSFinder):
         Returns:
             BFSolution: Basic feasible solution
         """
+        vam = get_vam() if self.use_numba else None
+        if vam is not None:
+            return self._find_initial_bfs_numba(vam, problem)
+
         supply = problem.supply.copy()
         demand = problem.demand.copy()
-        costs = np.array(problem.costs, dtype=float)
+        costs = problem.costs_np
         
         m, n = costs.shape
-        allocation = np.zeros((m, n), dtype=float)
-        basis = []
+        # basic cells and their allocation, in allocation order;
+        # every allocation retires a row or column, so m + n slots are enough
+        rows = np.empty(m + n, dtype=np.intp)
+        cols = np.empty(m + n, dtype=np.intp)
+        values = np.empty(m + n, dtype=np.float64)
+        count = 0
         
-        active_rows = set(range(m))
-        active_cols = set(range(n))
+        active_rows = np.ones(m, dtype=bool)
+        active_cols = np.ones(n, dtype=bool)
+        # active counts, kept in sync with the masks
+        num_rows, num_cols = m, n
         
-        while active_rows and active_cols:
-            # calc penalties
-            row_penalties = self._calculate_row_penalties(costs, active_rows, active_cols)
-            col_penalties = self._calculate_col_penalties(costs, active_rows, active_cols)
-            
-            # find maximum penalty
-            max_row_penalty = max(row_penalties.values()) if row_penalties else -1
-            max_col_penalty = max(col_penalties.values()) if col_penalties else -1
+        while num_rows and num_cols:
+            # calc penalties, only of the long side when the active block is skewed
+            skip_rows = skip_cols = False
+            if self.use_ma_modification:
+                skip_rows = num_cols >= self.SKIP_MINOR_PENALTY_RATIO * num_rows
+                skip_cols = num_rows >= self.SKIP_MINOR_PENALTY_RATIO * num_cols
+            row_penalties = (np.full(m, -np.inf) if skip_rows else 
+                             self._calculate_row_penalties(costs, active_rows, active_cols))
+            col_penalties = (np.full(n, -np.inf) if skip_cols else 
+                             self._calculate_col_penalties(costs, active_rows, active_cols))
             
-            if max_row_penalty == -1 and max_col_penalty == -1:
-                break
+            # find maximum penalty over rows then columns, so ties go to the row
+            k = int(np.argmax(np.concatenate((row_penalties, col_penalties))))
             
             # select cell
-            if max_row_penalty >= max_col_penalty:
-                i = max(row_penalties.keys(), key=lambda k: row_penalties[k])
-                j = min(active_cols, key=lambda j: costs[i, j])
+            if k < m:
+                i = k
+                j = int(np.argmin(np.where(active_cols, costs[i], np.inf)))
             else:
-                j = max(col_penalties.keys(), key=lambda k: col_penalties[k])
-                i = min(active_rows, key=lambda i: costs[i, j])
+                j = k - m
+                i = int(np.argmin(np.where(active_rows, costs[:, j], np.inf)))
             
             # allocate
             amount = min(supply[i], demand[j])
-            allocation[i, j] = amount
-            basis.append((i, j))
+            rows[count], cols[count], values[count] = i, j, amount
+            count += 1
             
             # update supply and demand
             supply[i] -= amount
@@ -56,38 +88,85 @@ class VogelsMethod(IBFSFinder):
             
             # remove exhausted row or column
             if supply[i] < self.EPSILON:
-                active_rows.discard(i)
+                active_rows[i] = False
+                num_rows -= 1
             if demand[j] < self.EPSILON:
-                active_cols.discard(j)
+                active_cols[j] = False
+                num_cols -= 1
         
-        total_cost = sum(
-            allocation[i, j] * problem.costs[i][j]
-            for i, j in basis
+        rows, cols, values = rows[:count], cols[:count], values[:count]
+        return BFSolution(
+            rows=rows,
+            cols=cols,
+            values=values,
+            cost=float(values @ costs[rows, cols]),
+            shape=(m, n)
+        )
+
+    def _find_initial_bfs_numba(self, vam: Callable, problem: TLPProblem) -> BFSolution:
+        """
+        Run VAM in the Numba-compiled kernel.
+        Args:
+            vam (Callable): Compiled kernel (see _vogel_numba.get_vam)
+            problem (TLPProblem): The transportation problem
+        Returns:
+            BFSolution: Basic feasible solution
+        """
+        costs = problem.costs_np
+        values, rows, cols, count = vam(
+            costs, 
+            problem.supply.copy(),
+            problem.demand.copy(),
+            self.SKIP_MINOR_PENALTY_RATIO if self.use_ma_modification else 0,
+            self.EPSILON
         )
+        values, rows, cols = values[:count], rows[:count], cols[:count]
         return BFSolution(
-            allocation=allocation.tolist(),
-            basis=basis,
-            cost=total_cost
+            rows=rows,
+            cols=cols,
+            values=values,
+            cost=float(values @ costs[rows, cols]),
+            shape=costs.shape
         )
 
-    def _calculate_row_penalties(self, costs: np.ndarray, active_rows: set, active_cols: set):
-        penalties = {}
-        for i in active_rows:
-            row_costs = [costs[i, j] for j in active_cols]
-            if len(row_costs) >= 2:
-                smallest = np.partition(row_costs, 1)[:2]
-                penalties[i] = smallest[1] - smallest[0]
-            elif len(row_costs) == 1:
-                penalties[i] = row_costs[0]
+    def _calculate_row_penalties(self, costs: np.ndarray, active_rows: np.ndarray, 
+                                 active_cols: np.ndarray) -> np.ndarray:
+        """
+        Row penalties: difference between the two smallest active costs in each row,
+        or the cost itself when a single column is active.
+        Args:
+            costs: Cost matrix of shape (m, n)
+            active_rows: Boolean mask of rows still in play
+            active_cols: Boolean mask of columns still in play
+        Returns:
+            np.ndarray: Penalty per row, -inf for inactive rows
+        """
+        penalties = np.full(costs.shape[0], -np.inf)
+        rows = np.flatnonzero(active_rows)
+        cols = np.flatnonzero(active_cols)
+        if rows.size == 0 or cols.size == 0:
+            return penalties
+        # only the active block, no inf padding of finished columns
+        sub = costs[rows][:, cols]
+        if cols.size == 1:
+            penalties[rows] = sub[:, 0]
+        else:
+            if cols.size <= self.SORT_MAX_COLS:
+                smallest = np.sort(sub, axis=1)
+            else:
+                smallest = np.partition(sub, 1, axis=1)
+            penalties[rows] = smallest[:, 1] - smallest[:, 0]
         return penalties
 
-    def _calculate_col_penalties(self, costs: np.ndarray, active_rows: set, active_cols: set):
-        penalties = {}
-        for j in active_cols:
-            col_costs = [costs[i, j] for i in active_rows]
-            if len(col_costs) >= 2:
-                smallest = np.partition(col_costs, 1)[:2]
-                penalties[j] = smallest[1] - smallest[0]
-            elif len(col_costs) == 1:
-                penalties[j] = col_costs[0]
-        return penalties
\ No newline at end of file
+    def _calculate_col_penalties(self, costs: np.ndarray, active_rows: np.ndarray, 
+                                 active_cols: np.ndarray) -> np.ndarray:
+        """
+        Column penalties, computed as row penalties of the transposed cost matrix.
+        Args:
+            costs: Cost matrix of shape (m, n)
+            active_rows: Boolean mask of rows still in play
+            active_cols: Boolean mask of columns still in play
+        Returns:
+            np.ndarray: Penalty per column, -inf for inactive columns
+        """
+        return self._calculate_row_penalties(costs.T, active_cols, active_rows)
\ No newline at end of file
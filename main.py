@@ -1,18 +1,33 @@
 import sys
+import argparse
 from PyQt6.QtWidgets import QApplication
 
-from core import TLPSolver, VogelsMethod, PotentialMethod
+import core
+from core import TLPSolver, VogelsMethod
 
 from view.app_window import TLPSolverApp
 from view import InputSection, ResultSection
 
 
+# algorithm class names in core; only the chosen one is imported (HiGHS pulls in SciPy)
+ALGORITHMS = {
+    "potentials": "PotentialMethod",
+    "highs": "HiGHSMethod",
+}
+
+
 def main():
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser(description="Transportation LP solver")
+    parser.add_argument(
+        "--algorithm", choices=ALGORITHMS, default="potentials",
+        help="optimization backend: Potentials (MODI) method or HiGHS via SciPy"
+    )
+    args, qt_args = parser.parse_known_args()
+    app = QApplication(sys.argv[:1] + qt_args)
 
     solver = TLPSolver(
         bfs_finder=VogelsMethod(),
-        algorithm=PotentialMethod()
+        algorithm=getattr(core, ALGORITHMS[args.algorithm])()
     )
     window = TLPSolverApp(
         input_section=InputSection(),
@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+from core.highs_method import HiGHSMethod
+from core.potential_method import PotentialMethod
+from utils import TLPProblem, BFSolution, SolutionStatus
+
+
+class TestHiGHSMethod(unittest.TestCase):
+    """Unit tests for HiGHSMethod (SciPy linprog) algorithm"""
+    def setUp(self):
+        """Set up test fixtures"""
+        self.method = HiGHSMethod()
+        self.problem = TLPProblem(
+            supply=[30, 40, 50],
+            demand=[35, 28, 57],
+            costs=[
+                [8, 6, 10],
+                [9, 12, 13],
+                [14, 9, 16]
+            ]
+        )
+        self.initial_bfs = BFSolution.from_dense(
+            allocation=[
+                [30.0, 0.0, 0.0],
+                [5.0, 28.0, 7.0],
+                [0.0, 0.0, 50.0]
+            ],
+            basis=[(0, 0), (1, 0), (1, 1), (1, 2), (2, 2)],
+            cost=30*8 + 5*9 + 28*12 + 7*13 + 50*16
+        )
+
+    def test_matches_potential_method(self):
+        """Test that HiGHS reaches the same optimal cost as MODI"""
+        result = self.method.solve_from_bfs(self.problem, self.initial_bfs)
+        expected = PotentialMethod().solve_from_bfs(self.problem, self.initial_bfs)
+
+        self.assertEqual(result.status, SolutionStatus.OPTIMAL.value)
+        self.assertAlmostEqual(result.optimal_value, expected.optimal_value, places=5)
+
+    def test_solution_maintains_constraints(self):
+        """Test that final solution maintains supply/demand constraints"""
+        result = self.method.solve_from_bfs(self.problem, self.initial_bfs)
+
+        solution = np.array(result.solution)
+        self.assertEqual(solution.shape, (3, 3))
+        self.assertTrue(np.all(solution >= -1e-9))
+        np.testing.assert_allclose(solution.sum(axis=1), self.problem.supply, rtol=1e-6)
+        np.testing.assert_allclose(solution.sum(axis=0), self.problem.demand, rtol=1e-6)
+
+    def test_unbalanced_problem_is_infeasible(self):
+        """Test that unbalanced equality constraints are reported as infeasible"""
+        problem = TLPProblem(
+            supply=[20, 30],
+            demand=[10, 10],
+            costs=[
+                [2, 3],
+                [4, 1]
+            ]
+        )
+        result = self.method.solve_from_bfs(problem, self.initial_bfs)
+
+        self.assertEqual(result.status, SolutionStatus.INFEASIBLE.value)
+        self.assertIsNone(result.solution)
+
+
+if __name__ == '__main__':
+    unittest.main()
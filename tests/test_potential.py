@@ -1,6 +1,8 @@
 import unittest
 import numpy as np
-from core.potential_method import PotentialMethod
+from core import TLPSolver, VogelsMethod
+from core.potential_method import PotentialMethod, BasisAllocation
+from core._modi_numba import NUMBA_AVAILABLE, get_kernels, _find_cycle
 from utils import TLPProblem, BFSolution, SolutionStatus
 
 
@@ -21,7 +23,7 @@ class TestPotentialMethod(unittest.TestCase):
             ]
         )
         # initial BFS (already optimal)
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=[
                 [20.0, 0.0],
                 [5.0, 25.0]
@@ -32,6 +34,7 @@ class TestPotentialMethod(unittest.TestCase):
         result = self.method.solve_from_bfs(problem, initial_bfs)
         
         self.assertEqual(result.status, SolutionStatus.OPTIMAL.value)
+        self.assertTrue(result.is_optimal)
         self.assertIsNotNone(result.optimal_value)
         self.assertIsNotNone(result.solution)
         self.assertAlmostEqual(result.optimal_value, 85.0, places=5)
@@ -48,7 +51,7 @@ class TestPotentialMethod(unittest.TestCase):
             ]
         )
         # suboptimal initial solution
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=[
                 [30.0, 0.0, 0.0],
                 [5.0, 28.0, 7.0],
@@ -75,7 +78,8 @@ class TestPotentialMethod(unittest.TestCase):
         basis = {(0, 0), (0, 1), (1, 1)}
         m, n = 2, 3
         
-        u, v = self.method._calculate_potentials(costs, basis, m, n)
+        rows_cells, cols_cells = self.method._build_adjacency(basis, m, n)
+        u, v = self.method._calculate_potentials(costs, rows_cells, cols_cells)
         
         # check that u_i + v_j = c_ij for all basic cells
         for i, j in basis:
@@ -90,16 +94,20 @@ class TestPotentialMethod(unittest.TestCase):
         entering_cell = (0, 1)
         m, n = 2, 3
         
-        cycle = self.method._find_cycle(entering_cell, basis, m, n)
+        rows_cells, cols_cells = self.method._build_adjacency(basis, m, n)
+        cycle = self.method._find_cycle(entering_cell, rows_cells, cols_cells)
         
         self.assertIsNotNone(cycle)
-        self.assertGreaterEqual(len(cycle), 4)
-        self.assertEqual(cycle[0], entering_cell)
-        self.assertEqual(cycle[-1], entering_cell)  # should return to start
+        ci, cj = cycle
+        self.assertEqual(ci.dtype, np.int32)
+        cells = list(zip(ci.tolist(), cj.tolist()))
+        self.assertGreaterEqual(len(cells), 4)
+        self.assertEqual(cells[0], entering_cell)
+        self.assertEqual(cells[-1], entering_cell)  # should return to start
         # should alternate between row/column moves
-        for i in range(len(cycle) - 1):
-            curr = cycle[i]
-            next_cell = cycle[i + 1]
+        for i in range(len(cells) - 1):
+            curr = cells[i]
+            next_cell = cells[i + 1]
             # either row or column should match, not both
             same_row = curr[0] == next_cell[0]
             same_col = curr[1] == next_cell[1]
@@ -112,29 +120,90 @@ class TestPotentialMethod(unittest.TestCase):
         entering_cell = (0, 1)
         m, n = 2, 2
         
-        cycle = self.method._find_cycle(entering_cell, basis, m, n)
+        rows_cells, cols_cells = self.method._build_adjacency(basis, m, n)
+        cycle = self.method._find_cycle(entering_cell, rows_cells, cols_cells)
         
         # return None or empty list
         self.assertIsNone(cycle)
     
+    def test_find_cycle_kernel_matches_python(self):
+        """Test that the compiled cycle finder returns the same cycle as _find_cycle"""
+        basis = {(0, 0), (0, 2), (1, 1), (1, 2), (2, 0), (2, 1)}
+        entering_cell = (0, 1)
+        m, n = 3, 3
+        
+        rows_cells, cols_cells = self.method._build_adjacency(basis, m, n)
+        ci, cj = self.method._find_cycle(entering_cell, rows_cells, cols_cells)
+        
+        row_adj = np.zeros((m, n), dtype=np.int64)
+        col_adj = np.zeros((n, m), dtype=np.int64)
+        for i, cells in enumerate(rows_cells):
+            row_adj[i, :len(cells)] = cells
+        for j, cells in enumerate(cols_cells):
+            col_adj[j, :len(cells)] = cells
+        row_cnt = np.array([len(cells) for cells in rows_cells], dtype=np.int64)
+        col_cnt = np.array([len(cells) for cells in cols_cells], dtype=np.int64)
+        path_i, path_j, cursor = (np.empty(2 * (m + n) + 2, dtype=np.int64) for _ in range(3))
+        in_path = np.zeros((m, n), dtype=bool)
+        
+        kernels = get_kernels()
+        find_cycle = kernels.find_cycle if kernels is not None else _find_cycle
+        plen = find_cycle(*entering_cell, row_adj, row_cnt, col_adj, col_cnt, 
+                          path_i, path_j, cursor, in_path)
+        # python cycle repeats the entering cell at the end
+        np.testing.assert_array_equal(path_i[:plen], ci[:-1])
+        np.testing.assert_array_equal(path_j[:plen], cj[:-1])
+        self.assertFalse(in_path.any())
+    
     def test_update_solution(self):
         """Test solution update along cycle"""
         allocation = np.array([
             [10.0, 0.0, 20.0],
             [0.0, 15.0, 5.0]
         ])
-        basis = {(0, 0), (0, 2), (1, 1), (1, 2)}
-        cycle = [(0, 1), (0, 2), (1, 2), (1, 1)]  # cycle
+        cells = {(0, 0), (0, 2), (1, 1), (1, 2)}
+        basis = BasisAllocation.from_bfs(BFSolution.from_dense(allocation, sorted(cells), 0.0))
+        rows_cells, cols_cells = self.method._build_adjacency(cells, 2, 3)
+        cycle = (np.array([0, 0, 1, 1], dtype=np.int32), 
+                 np.array([1, 2, 2, 1], dtype=np.int32))  # cycle (0,1) (0,2) (1,2) (1,1)
         
-        new_allocation, new_basis = self.method._update_solution(
-            allocation, basis, cycle
-        )
+        new_basis = self.method._update_solution(basis, rows_cells, cols_cells, cycle)
+        new_allocation = new_basis.to_dense(2, 3)
         # check that allocation is still valid
         self.assertTrue(np.all(new_allocation >= -self.method.EPSILON))
+        np.testing.assert_allclose(new_allocation.sum(axis=1), allocation.sum(axis=1))
+        np.testing.assert_allclose(new_allocation.sum(axis=0), allocation.sum(axis=0))
         # check basis size
-        self.assertEqual(len(new_basis), len(basis))
+        self.assertEqual(len(new_basis), len(cells))
         # entering cell should be in new basis
-        self.assertIn(cycle[0], new_basis)
+        self.assertIn((0, 1), new_basis)
+        # index arrays and adjacency should mirror the basis
+        self.assertEqual(set(zip(new_basis.bi.tolist(), new_basis.bj.tolist())), set(new_basis))
+        self.assertEqual(
+            {cell: k for k, cell in enumerate(new_basis)}, new_basis.slot
+        )
+        self.assertEqual(
+            {(i, j) for i, row in enumerate(rows_cells) for j in row}, set(new_basis)
+        )
+    
+    def test_shift_potentials(self):
+        """Test that shifted potentials solve u_i + v_j = c_ij on the new basis"""
+        costs = np.array([
+            [8.0, 6.0, 10.0],
+            [9.0, 12.0, 13.0]
+        ])
+        cells = {(0, 0), (0, 2), (1, 1), (1, 2)}
+        basis = BasisAllocation([0, 0, 1, 1], [0, 2, 1, 2], [10.0, 20.0, 15.0, 5.0])
+        rows_cells, cols_cells = self.method._build_adjacency(cells, 2, 3)
+        u, v = self.method._calculate_potentials(costs, rows_cells, cols_cells)
+        cycle = self.method._find_cycle((0, 1), rows_cells, cols_cells)
+        
+        basis = self.method._update_solution(basis, rows_cells, cols_cells, cycle)
+        rows, cols = self.method._shift_potentials(costs, u, v, (0, 1), rows_cells, cols_cells)
+        
+        self.assertGreater(rows.size + cols.size, 0)
+        for i, j in basis:
+            self.assertAlmostEqual(u[i] + v[j], costs[i, j], places=5)
     
     def test_degenerate_case(self):
         """Test handling of degenerate solution"""
@@ -147,7 +216,7 @@ class TestPotentialMethod(unittest.TestCase):
             ]
         )
         # degenerate initial solution
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=[
                 [10.0, 0.0],
                 [0.0, 10.0]
@@ -175,7 +244,7 @@ class TestPotentialMethod(unittest.TestCase):
         )
         
         # non-optimal initial solution
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=[
                 [0.0, 100.0],
                 [100.0, 0.0]
@@ -187,6 +256,7 @@ class TestPotentialMethod(unittest.TestCase):
         result = method.solve_from_bfs(problem, initial_bfs)
         
         self.assertEqual(result.status, SolutionStatus.ERROR.value)
+        self.assertFalse(result.is_optimal)
         self.assertIn("Max iterations", result.error_message)
     
     def test_invalid_basis(self):
@@ -200,7 +270,7 @@ class TestPotentialMethod(unittest.TestCase):
             ]
         )
         # invalid basis (disconnected)
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=[
                 [20.0, 0.0],
                 [5.0, 25.0]
@@ -239,7 +309,7 @@ class TestPotentialMethod(unittest.TestCase):
                     supply_left[i] -= amount
                     demand_left[j] -= amount
         
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=allocation.tolist(),
             basis=basis,
             cost=float(np.sum(allocation * np.array(problem.costs)))
@@ -259,7 +329,7 @@ class TestPotentialMethod(unittest.TestCase):
                 [3, 0]
             ]
         )
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=[
                 [15.0, 0.0],
                 [5.0, 20.0]
@@ -285,7 +355,7 @@ class TestPotentialMethod(unittest.TestCase):
             ]
         )
         # any valid initial BFS
-        initial_bfs = BFSolution(
+        initial_bfs = BFSolution.from_dense(
             allocation=[
                 [100.0, 0.0, 0.0],
                 [20.0, 130.0, 0.0],
@@ -310,6 +380,115 @@ class TestPotentialMethod(unittest.TestCase):
         for j, demand in enumerate(problem.demand):
             self.assertAlmostEqual(col_sums[j], demand, places=4)
 
+    
+    def test_solve_batch_matches_single(self):
+        """Test that batched solving gives the same results as solving one by one"""
+        problems = [
+            TLPProblem(supply=[30, 40, 50], demand=[35, 28, 57],
+                       costs=[[8, 6, 10], [9, 12, 13], [14, 9, 16]]),
+            TLPProblem(supply=[20, 30, 25], demand=[15, 35, 25],
+                       costs=[[4, 6, 8], [5, 9, 7], [6, 3, 9]]),
+            TLPProblem(supply=[20, 30], demand=[10, 25, 5],
+                       costs=[[2, 3, 1], [4, 1, 5]]),
+            TLPProblem(supply=[50, 30], demand=[25, 25],  # unbalanced, gets balanced to 2x3
+                       costs=[[3, 1], [2, 4]]),
+        ]
+        solver = TLPSolver(VogelsMethod(), PotentialMethod(use_numba=False))
+        
+        batch_results = solver.solve_batch(problems)
+        
+        self.assertEqual(len(batch_results), len(problems))
+        for problem, result in zip(problems, batch_results):
+            expected = solver.solve(problem)
+            self.assertEqual(result.status, expected.status)
+            self.assertAlmostEqual(result.optimal_value, expected.optimal_value, places=5)
+            np.testing.assert_allclose(result.solution, expected.solution)
+    
+    def test_solve_reuses_padded_buffer(self):
+        """Test that consecutive unbalanced problems don't leak padded costs into each other"""
+        problems = [
+            TLPProblem(supply=[50, 30], demand=[25, 25], costs=[[3, 1], [2, 4]]),
+            TLPProblem(supply=[10, 20], demand=[15, 25, 10], costs=[[5, 2, 7], [3, 6, 1]]),
+            TLPProblem(supply=[40, 30], demand=[20, 25], costs=[[1, 9], [8, 2]]),
+        ]
+        solver = TLPSolver(VogelsMethod(), PotentialMethod())
+        
+        for problem in problems:
+            result = solver.solve(problem)
+            expected = TLPSolver(VogelsMethod(), PotentialMethod()).solve(problem)
+            self.assertEqual(result.status, SolutionStatus.OPTIMAL.value)
+            self.assertAlmostEqual(result.optimal_value, expected.optimal_value, places=5)
+            np.testing.assert_allclose(result.solution, expected.solution)
+    
+    def test_solve_batch_error_results_are_distinct(self):
+        """Test that a failing batch gives every problem its own error result"""
+        class FailingMethod(PotentialMethod):
+            def solve_batch_from_bfs(self, problems, initial_solutions):
+                raise RuntimeError("boom")
+        
+        problem = TLPProblem(supply=[20, 30], demand=[25, 25], costs=[[3, 1], [2, 4]])
+        results = TLPSolver(VogelsMethod(), FailingMethod()).solve_batch([problem, problem])
+        
+        self.assertEqual([r.status for r in results], [SolutionStatus.ERROR] * 2)
+        self.assertIsNot(results[0], results[1])
+    
+    def test_solve_batch_error_stays_per_problem(self):
+        """Test that a problem failing inside the batch does not end the others"""
+        class FlakyMethod(PotentialMethod):
+            def _calculate_potentials(self, costs, rows_cells, cols_cells):
+                if costs[0, 0] == 99:
+                    raise RuntimeError("disconnected basis")
+                return super()._calculate_potentials(costs, rows_cells, cols_cells)
+        
+        problems = [
+            TLPProblem(supply=[30, 40, 50], demand=[35, 28, 57],
+                       costs=[[8, 6, 10], [9, 12, 13], [14, 9, 16]]),
+            TLPProblem(supply=[20, 30, 25], demand=[15, 35, 25],
+                       costs=[[99, 6, 8], [5, 9, 7], [6, 3, 9]]),
+            TLPProblem(supply=[20, 30, 25], demand=[15, 35, 25],
+                       costs=[[4, 6, 8], [5, 9, 7], [6, 3, 9]]),
+        ]
+        vogel = VogelsMethod()
+        method = FlakyMethod(use_numba=False)
+        initial_solutions = [vogel.find_initial_bfs(problem) for problem in problems]
+        
+        results = method.solve_batch_from_bfs(problems, initial_solutions)
+        
+        self.assertEqual(results[1].status, SolutionStatus.ERROR)
+        self.assertIn("disconnected basis", results[1].error_message)
+        for k in (0, 2):
+            expected = method.solve_from_bfs(problems[k], initial_solutions[k])
+            self.assertEqual(results[k].status, SolutionStatus.OPTIMAL)
+            self.assertAlmostEqual(results[k].optimal_value, expected.optimal_value, places=5)
+            np.testing.assert_allclose(results[k].solution, expected.solution)
+    
+    @unittest.skipIf(not NUMBA_AVAILABLE, "numba is not installed")
+    def test_numba_matches_python(self):
+        """Test that the compiled kernel follows the same pivots as the Python path"""
+        problem = TLPProblem(
+            supply=[30, 40, 50],
+            demand=[35, 28, 57],
+            costs=[
+                [8, 6, 10],
+                [9, 12, 13],
+                [14, 9, 16]
+            ]
+        )
+        initial_bfs = BFSolution.from_dense(
+            allocation=[
+                [30.0, 0.0, 0.0],
+                [5.0, 28.0, 7.0],
+                [0.0, 0.0, 50.0]
+            ],
+            basis=[(0, 0), (1, 0), (1, 1), (1, 2), (2, 2)],
+            cost=30*8 + 5*9 + 28*12 + 7*13 + 50*16
+        )
+        numba_result = PotentialMethod(use_numba=True).solve_from_bfs(problem, initial_bfs)
+        python_result = PotentialMethod(use_numba=False).solve_from_bfs(problem, initial_bfs)
+        
+        self.assertEqual(numba_result.status, python_result.status)
+        self.assertAlmostEqual(numba_result.optimal_value, python_result.optimal_value, places=5)
+        np.testing.assert_allclose(numba_result.solution, python_result.solution)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
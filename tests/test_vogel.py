@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 from utils import TLPProblem, BFSolution
 from core import VogelsMethod
+from core._vogel_numba import NUMBA_AVAILABLE
 
 # fixtures
 @pytest.fixture
@@ -40,22 +41,22 @@ class TestVogelsPenalties:
     def setup_method(self, method):
         self.costs = np.array([[2.0, 3.0, 1.0], 
                                [4.0, 1.0, 5.0]])
-        self.active_rows = {0, 1}
-        self.active_cols = {0, 1, 2}
+        self.active_rows = np.array([True, True])
+        self.active_cols = np.array([True, True, True])
         self.vm = VogelsMethod()
 
     def test_calculate_row_penalties_full(self):
         penalties = self.vm._calculate_row_penalties(self.costs, self.active_rows, self.active_cols)
-        assert penalties == {0: 1.0, 1: 3.0}
+        assert np.array_equal(penalties, [1.0, 3.0])
 
     def test_calculate_col_penalties_full(self):
         penalties = self.vm._calculate_col_penalties(self.costs, self.active_rows, self.active_cols)
-        assert penalties == {0: 2.0, 1: 2.0, 2: 4.0}
+        assert np.array_equal(penalties, [2.0, 2.0, 4.0])
 
     def test_calculate_row_penalties_partial(self):
-        active_cols_partial = {0}
+        active_cols_partial = np.array([True, False, False])
         penalties = self.vm._calculate_row_penalties(self.costs, self.active_rows, active_cols_partial)
-        assert penalties == {0: 2.0, 1: 4.0}
+        assert np.array_equal(penalties, [2.0, 4.0])
 
 
 
@@ -101,4 +102,50 @@ class TestVogelsMethodFindInitialBFS:
         assert np.allclose(solution.allocation, expected_allocation)
         assert solution.cost == pytest.approx(expected_cost)
         assert set(solution.basis) == set(expected_basis)
-        assert len(solution.basis) == 2 # expected degeneracy (m + n - 1 = 3)
\ No newline at end of file
+        assert len(solution.basis) == 2 # expected degeneracy (m + n - 1 = 3)
+
+    def test_ma_modification_on_tall_problem(self):
+        # row A2 has the largest row penalty (5), column B1 the largest penalty overall (9)
+        costs = [[1.0, 2.0], [10.0, 5.0]] + [[10.0, 10.0]] * 6
+        problem = TLPProblem(supply=[10.0] * 8, demand=[40.0, 40.0], costs=costs)
+
+        ma_solution = VogelsMethod(use_ma_modification=True).find_initial_bfs(problem)
+        vam_solution = VogelsMethod(use_ma_modification=False).find_initial_bfs(problem)
+
+        # with 8 >= 4 * 2 active rows the column penalties are skipped, so the
+        # first pick follows row A2; strict VAM follows column B1
+        assert ma_solution.basis[0] == (1, 1)
+        assert vam_solution.basis[0] == (0, 0)
+        for solution in (ma_solution, vam_solution):
+            allocation = np.array(solution.allocation)
+            assert np.allclose(allocation.sum(axis=1), problem.supply)
+            assert np.allclose(allocation.sum(axis=0), problem.demand)
+
+    def test_ma_modification_skips_column_penalties(self, monkeypatch):
+        problem = TLPProblem(supply=[10.0] * 8, demand=[40.0, 40.0], 
+                             costs=[[float(i + j) for j in range(2)] for i in range(8)])
+
+        for use_ma_modification in (True, False):
+            method = VogelsMethod(use_numba=False, use_ma_modification=use_ma_modification)
+            calls = []
+            original = method._calculate_col_penalties
+            def spy(costs, active_rows, active_cols, original=original, calls=calls):
+                calls.append((int(active_rows.sum()), int(active_cols.sum())))
+                return original(costs, active_rows, active_cols)
+            monkeypatch.setattr(method, "_calculate_col_penalties", spy)
+            method.find_initial_bfs(problem)
+
+            if use_ma_modification:
+                # only called once the active block is no longer 4x taller than wide
+                assert all(rows < VogelsMethod.SKIP_MINOR_PENALTY_RATIO * cols for rows, cols in calls)
+            else:
+                assert calls and calls[0] == (8, 2)
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+    def test_numba_matches_python(self, standard_balanced_problem: TLPProblem):
+        numba_solution = VogelsMethod(use_numba=True).find_initial_bfs(standard_balanced_problem)
+        python_solution = VogelsMethod(use_numba=False).find_initial_bfs(standard_balanced_problem)
+
+        assert numba_solution.basis == python_solution.basis
+        assert np.array_equal(numba_solution.allocation, python_solution.allocation)
+        assert numba_solution.cost == pytest.approx(python_solution.cost)
\ No newline at end of file
@@ -1,10 +1,27 @@
+import importlib
 from .constants import (
     AppConstants, InputWidgetConstants, ResultWidgetConstants,
     SolutionStatus, StatusColor, StatusFormatter
 )
 from .interfaces import IBFSFinder, ITransportationAlgorithm
 from .containers import TLPProblem, TLPResult, BFSolution
-from .formatters import ResultFormatter
-from .stylesheet import StyleSheet
-from .ui_helper import UIHelper
-from .validators import InputValidator
\ No newline at end of file
+
+# UI helpers pull in PyQt6, so they are imported on first access (PEP 562)
+_LAZY = {
+    'ResultFormatter': '.formatters',
+    'StyleSheet': '.stylesheet',
+    'UIHelper': '.ui_helper',
+    'InputValidator': '.validators',
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
\ No newline at end of file
@@ -1,12 +1,19 @@
 from enum import Enum
+from typing import Final, Optional
 
-class SolutionStatus(Enum):
+class SolutionStatus(str, Enum):
+    # str mixin: members compare and hash like their values, as stored in TLPResult.status
     OPTIMAL = 'optimal'
     INFEASIBLE = 'infeasible'
     UNBOUNDED = 'unbounded'
     ERROR = 'error'
     UNKNOWN = 'unknown'
     PENDING = 'pending'
+    
+    @classmethod
+    def from_str(cls, value: str, default: Optional['SolutionStatus'] = None) -> Optional['SolutionStatus']:
+        """Member for a status string (case-insensitive), default if there is none"""
+        return _STATUS_BY_STR.get(value.lower(), default)
 
 class StatusColor(Enum):
     OPTIMAL = '#4CAF50'
@@ -19,7 +26,7 @@ class StatusColor(Enum):
     @staticmethod
     def get_color(status: SolutionStatus) -> str:
         """Get color for given status"""
-        return StatusColor[status.name].value
+        return _STATUS_COLOR_MAP[status]
 
 class StatusFormatter:
     """Status formatting utilities"""
@@ -31,34 +38,55 @@ class StatusFormatter:
         SolutionStatus.UNKNOWN: "Unknown Status",
         SolutionStatus.PENDING: "Solving...",
     }
+    
+    @staticmethod
+    def format_status(status: SolutionStatus) -> tuple:
+        """Get (label, color) for given status"""
+        return _STATUS_LABEL_MAP[status], _STATUS_COLOR_MAP[status]
 
 # app
 class AppConstants:
-    WINDOW_TITLE = "Transportation Linear Programming Solver"
-    WINDOW_SIZE = (900, 700)
-    TITLE_FONT_SIZE = 16
-    BUTTON_HEIGHT = 40
-    BUTTON_FONT_SIZE = 12
-    LAYOUT_SPACING = 15
-    LAYOUT_MARGINS = 15
+    WINDOW_TITLE: Final = "Transportation Linear Programming Solver"
+    WINDOW_SIZE: Final = (900, 700)
+    TITLE_FONT_SIZE: Final = 16
+    BUTTON_HEIGHT: Final = 40
+    BUTTON_FONT_SIZE: Final = 12
+    LAYOUT_SPACING: Final = 15
+    LAYOUT_MARGINS: Final = 15
 
 # input widget
 class InputWidgetConstants:
     # spinbox settings
-    MAX_SUPPLIERS = 20
-    MAX_CONSUMERS = 20
-    DEFAULT_SUPPLIERS = 3
-    DEFAULT_CONSUMERS = 4
-    SPINBOX_WIDTH = 100
+    MAX_SUPPLIERS: Final = 20
+    MAX_CONSUMERS: Final = 20
+    DEFAULT_SUPPLIERS: Final = 3
+    DEFAULT_CONSUMERS: Final = 4
+    SPINBOX_WIDTH: Final = 100
+    REBUILD_DELAY_MS: Final = 100
     
     # layout widths
-    MAX_SECTION_WIDTH = 800
-    LABEL_WIDTH = 40
-    VALUE_INPUT_WIDTH = 80
-    COST_INPUT_WIDTH = 70
-    MATRIX_HEADER_WIDTH = 50
+    MAX_SECTION_WIDTH: Final = 800
+    LABEL_WIDTH: Final = 40
+    VALUE_INPUT_WIDTH: Final = 80
+    COST_INPUT_WIDTH: Final = 70
+    MATRIX_HEADER_WIDTH: Final = 50
+    
+    # row / column names, built once up to the largest form
+    SUPPLIER_LABELS: Final = tuple(f"A{i+1}" for i in range(MAX_SUPPLIERS))
+    CONSUMER_LABELS: Final = tuple(f"B{j+1}" for j in range(MAX_CONSUMERS))
+    
+    # numeric input limits
+    MAX_INPUT_VALUE: Final = 1e12
+    INPUT_DECIMALS: Final = 6
 
 # result widget
 class ResultWidgetConstants:
-    MIN_MATRIX_HEIGHT = 300
-    SUMMARY_HEIGHT = 200
\ No newline at end of file
+    MIN_MATRIX_HEIGHT: Final = 300
+    SUMMARY_HEIGHT: Final = 200
+    SUMMARY_PLACEHOLDER: Final = "Computing summary…"
+
+# status lookups, built once; module-private, read through StatusColor.get_color,
+# StatusFormatter.format_status and SolutionStatus.from_str
+_STATUS_COLOR_MAP = {status: StatusColor[status.name].value for status in SolutionStatus}
+_STATUS_LABEL_MAP = dict(StatusFormatter.STATUS_LABELS)
+_STATUS_BY_STR = {status.value: status for status in SolutionStatus}
\ No newline at end of file
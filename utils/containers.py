@@ -1,41 +1,82 @@
-from typing import List, Optional
+import numpy as np
+from typing import List, Optional, Tuple
+from functools import cached_property
 from utils.constants import SolutionStatus
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(eq=False)
 class TLPProblem:
-    """Container for Transportation LP problem data"""
-    supply: List[float]         # supply at each supplier (A_i)
-    demand: List[float]         # demand at each consumer (B_j)
-    costs: List[List[float]]    # cost matrix C[i][j] - cost from supplier i to consumer j
+    """Container for Transportation LP problem data, stored as float64 arrays"""
+    supply: np.ndarray          # supply at each supplier (A_i), shape (m,)
+    demand: np.ndarray          # demand at each consumer (B_j), shape (n,)
+    costs: np.ndarray           # cost matrix C[i][j] - cost from supplier i to consumer j, shape (m, n)
+    
+    def __post_init__(self) -> None:
+        """Convert lists (or arrays of another dtype) once, at construction"""
+        self.supply = np.ascontiguousarray(self.supply, dtype=np.float64)
+        self.demand = np.ascontiguousarray(self.demand, dtype=np.float64)
+        self.costs = np.ascontiguousarray(self.costs, dtype=np.float64)
+    
+    @property
+    def costs_np(self) -> np.ndarray:
+        """Cost matrix as a C-contiguous float64 array"""
+        return self.costs
     
     @property
     def num_suppliers(self) -> int:
         """Number of suppliers (m)"""
-        return len(self.supply)
+        return self.supply.shape[0]
     
     @property
     def num_consumers(self) -> int:
         """Number of consumers (n)"""
-        return len(self.demand)
+        return self.demand.shape[0]
     
-    @property
+    @cached_property
     def total_supply(self) -> float:
-        """Total available supply"""
-        return sum(self.supply)
+        """Total available supply (computed once, supply is not expected to change)"""
+        return float(self.supply.sum())
     
-    @property
+    @cached_property
     def total_demand(self) -> float:
-        """Total required demand"""
-        return sum(self.demand)
+        """Total required demand (computed once, demand is not expected to change)"""
+        return float(self.demand.sum())
     
     def is_balanced(self) -> bool:
         """Check if problem is balanced (supply == demand)"""
         return abs(self.total_supply - self.total_demand) < 1e-6
+    
+    def padded_view(self, extra_row: bool, extra_col: bool, deficit: float,
+                    buffer: Optional[np.ndarray] = None) -> 'TLPProblem':
+        """
+        Problem extended by a zero-cost dummy supplier and/or consumer.
+        Args:
+            extra_row: Add a dummy supplier with supply = deficit
+            extra_col: Add a dummy consumer with demand = deficit
+            deficit: Amount the dummy supplier/consumer takes
+            buffer: Flat float64 array the padded costs are written into, so repeated
+                calls can reuse it; a new one is allocated if missing or too small
+        Returns:
+            TLPProblem: Padded problem whose costs are a C-contiguous view into buffer
+        """
+        m, n = self.costs_np.shape
+        rows, cols = m + int(extra_row), n + int(extra_col)
+        if buffer is None or buffer.size < rows * cols:
+            buffer = np.empty(rows * cols, dtype=np.float64)
+        costs = buffer[:rows * cols].reshape(rows, cols)
+        costs[:m, :n] = self.costs_np
+        costs[m:, :] = 0.0
+        costs[:, n:] = 0.0
+
+        return TLPProblem(
+            supply=np.append(self.supply, deficit) if extra_row else self.supply,
+            demand=np.append(self.demand, deficit) if extra_col else self.demand,
+            costs=costs
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class TLPResult:
     """Container for Transportation LP problem results"""
     status: SolutionStatus
@@ -46,12 +87,49 @@ class TLPResult:
     @property
     def is_optimal(self) -> bool:
         """Check if optimal solution was found"""
-        return SolutionStatus.OPTIMAL.value
+        # solvers store the member itself, plain strings still compare equal (str enum)
+        return self.status is SolutionStatus.OPTIMAL or self.status == SolutionStatus.OPTIMAL
 
 
-@dataclass
+@dataclass(slots=True)
 class BFSolution:
-    """Basic Feasible Solution (BFS) representation"""
-    allocation: List[List[float]]   # current allocation matrix
-    basis: List[tuple]              # list of basic variables (i, j)
-    cost: float                     # total cost of current solution
\ No newline at end of file
+    """Basic Feasible Solution (BFS) representation, stored sparsely as basic cells only"""
+    rows: np.ndarray                # row index i of each basic variable
+    cols: np.ndarray                # column index j of each basic variable
+    values: np.ndarray              # allocation x_ij of each basic variable
+    cost: float                     # total cost of current solution
+    shape: Tuple[int, int]          # (m, n) of the full allocation matrix
+    
+    @classmethod
+    def from_dense(cls, allocation: List[List[float]], basis: List[tuple], 
+                   cost: float) -> 'BFSolution':
+        """
+        Build a BFS from a full allocation matrix and its basic variables.
+        Args:
+            allocation: Allocation matrix X[i][j]
+            basis: Basic variables (i, j)
+            cost: Total cost of the allocation
+        Returns:
+            BFSolution: The same solution keeping only the basic cells
+        """
+        allocation = np.asarray(allocation, dtype=np.float64)
+        rows = np.fromiter((i for i, _ in basis), dtype=np.intp, count=len(basis))
+        cols = np.fromiter((j for _, j in basis), dtype=np.intp, count=len(basis))
+        return cls(rows=rows, cols=cols, values=allocation[rows, cols], cost=cost, 
+                   shape=allocation.shape)
+    
+    @property
+    def basis(self) -> List[tuple]:
+        """Basic variables (i, j)"""
+        return list(zip(self.rows.tolist(), self.cols.tolist()))
+    
+    @property
+    def allocation(self) -> List[List[float]]:
+        """Full allocation matrix X[i][j]"""
+        return self.to_dense().tolist()
+    
+    def to_dense(self) -> np.ndarray:
+        """Full allocation matrix as an (m, n) array"""
+        dense = np.zeros(self.shape, dtype=np.float64)
+        dense[self.rows, self.cols] = self.values
+        return dense
\ No newline at end of file
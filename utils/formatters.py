@@ -1,4 +1,5 @@
-from typing import List, Tuple
+import numpy as np
+from typing import List, Tuple, Union
 from utils import TLPResult, SolutionStatus, StatusColor, StatusFormatter
 
 
@@ -6,21 +7,35 @@ class ResultFormatter:
     """Formats Transportation LP optimization results for display"""
     
     @staticmethod
-    def format_status(status: str) -> Tuple[str, str]:
+    def format_status(status: Union[str, SolutionStatus]) -> Tuple[str, str]:
         """
         Format status text and return corresponding color.
         Args:
-            status: Status string from solver (will be converted to SolutionStatus)
+            status: SolutionStatus, or status string from solver (will be converted to SolutionStatus)
         Returns:
             Tuple of (formatted_status, color_hex)
         """
-        try:
-            status_enum = SolutionStatus(status.lower())
-            status_str = StatusFormatter.STATUS_LABELS.get(status_enum, status.capitalize())
-            status_color = StatusColor.get_color(status_enum)
-            return status_str, status_color
-        except (ValueError, AttributeError):
-            return status.capitalize(), StatusColor.UNKNOWN.value
+        if isinstance(status, SolutionStatus):
+            return StatusFormatter.format_status(status)
+        status_enum = SolutionStatus.from_str(status) if isinstance(status, str) else None
+        if status_enum is None:
+            return str(status).capitalize(), StatusColor.UNKNOWN.value
+        return StatusFormatter.format_status(status_enum)
+    
+    @staticmethod
+    def resolve_status(status: Union[str, SolutionStatus]) -> SolutionStatus:
+        """
+        Resolve a status to its SolutionStatus member.
+        Args:
+            status: SolutionStatus, or status string from solver
+        Returns:
+            SolutionStatus: Matching member, SolutionStatus.UNKNOWN if not recognised
+        """
+        if isinstance(status, SolutionStatus):
+            return status
+        if isinstance(status, str):
+            return SolutionStatus.from_str(status, SolutionStatus.UNKNOWN)
+        return SolutionStatus.UNKNOWN
     
     @staticmethod
     def format_optimal_value(value: float) -> str:
@@ -46,6 +61,18 @@ class ResultFormatter:
             return "—"
         return f"{value:.2f}"
     
+    @staticmethod
+    def format_allocation_matrix(matrix: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """
+        Format a whole allocation matrix at once, same rules as format_allocation_value.
+        Args:
+            matrix: 2D matrix of allocation amounts
+        Returns:
+            np.ndarray: Matrix of formatted strings
+        """
+        values = np.asarray(matrix, dtype=float)
+        return np.where(np.abs(values) < 1e-6, "—", np.char.mod("%.2f", values))
+    
     @staticmethod
     def format_summary(result: TLPResult) -> str:
         """
@@ -72,17 +99,12 @@ class ResultFormatter:
         lines.append("Transportation Routes (non-zero allocations):")
         lines.append("-" * 60)
         
-        solution = result.solution
-        num_suppliers = len(solution)
-        num_consumers = len(solution[0]) if solution else 0
-        
-        route_count = 0
-        for i in range(num_suppliers):
-            for j in range(num_consumers):
-                amount = solution[i][j]
-                if amount > 1e-6:
-                    route_count += 1
-                    lines.append(f"  A{i+1} → B{j+1}: {amount:.2f} units")
+        # only the (at most m+n-1) non-zero cells are visited
+        solution = np.asarray(result.solution, dtype=float)
+        rows, cols = np.nonzero(solution > 1e-6)
+        for i, j, amount in zip(rows.tolist(), cols.tolist(), solution[rows, cols].tolist()):
+            lines.append(f"  A{i+1} → B{j+1}: {amount:.2f} units")
+        route_count = len(rows)
         
         if route_count == 0:
             lines.append("  No active routes")
@@ -131,11 +153,9 @@ class ResultFormatter:
         lines.append("-" * len(header))
         
         # data rows
-        for i, row in enumerate(matrix):
-            row_str = f"{row_labels[i]:<{row_label_width}} |"
-            for j, value in enumerate(row):
-                formatted = ResultFormatter.format_allocation_value(value)
-                row_str += f" {formatted:>{col_widths[j]}} |"
-            lines.append(row_str)
+        formatted = ResultFormatter.format_allocation_matrix(matrix).tolist()
+        for label, row in zip(row_labels, formatted):
+            cells = "".join(f" {value:>{w}} |" for value, w in zip(row, col_widths))
+            lines.append(f"{label:<{row_label_width}} |{cells}")
         
         return "\n".join(lines)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 from utils.containers import TLPProblem, BFSolution, TLPResult
 
 
@@ -31,4 +32,21 @@ class ITransportationAlgorithm(ABC):
         Returns:
             TLPResult: The solution containing optimal value and solution
         """
-        pass
\ No newline at end of file
+        pass
+
+    def solve_batch_from_bfs(self, problems: List[TLPProblem], 
+                             initial_solutions: List[BFSolution]) -> List[TLPResult]:
+        """
+        Solve several independent problems of equal shape.
+        Implementations may override it to share work across the batch,
+        by default problems are solved one by one.
+        Args:
+            problems (List[TLPProblem]): The transportation problems to solve
+            initial_solutions (List[BFSolution]): Initial basic feasible solution per problem
+        Returns:
+            List[TLPResult]: The solution per problem, in input order
+        """
+        return [
+            self.solve_from_bfs(problem, initial_solution)
+            for problem, initial_solution in zip(problems, initial_solutions)
+        ]
\ No newline at end of file
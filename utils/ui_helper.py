@@ -1,5 +1,7 @@
-from typing import Optional
-from PyQt6.QtWidgets import QLabel, QLineEdit, QSpinBox, QLayout
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from PyQt6.QtWidgets import QLabel, QLineEdit, QSpinBox, QLayout, QWidget
+from PyQt6.QtGui import QValidator
 
 
 class UIHelper:
@@ -13,11 +15,31 @@ class UIHelper:
                 item.widget().deleteLater()
     
     @staticmethod
-    def create_numeric_input(placeholder: str = "0", max_width: int = 70) -> QLineEdit:
+    @contextmanager
+    def frozen(widget: QWidget) -> Iterator[QWidget]:
+        """
+        Suspend repaints of a widget and its children during a bulk update,
+        so the whole batch costs one repaint. Signals are left alone, children
+        that must stay quiet need their own QSignalBlocker.
+        Args:
+            widget: Container whose children are being added/removed
+        """
+        widget.setUpdatesEnabled(False)
+        try:
+            yield widget
+        finally:
+            widget.setUpdatesEnabled(True)
+            widget.update()
+    
+    @staticmethod
+    def create_numeric_input(placeholder: str = "0", max_width: int = 70,
+                             validator: Optional[QValidator] = None) -> QLineEdit:
         """Factory method for numeric input fields"""
         line_edit = QLineEdit()
         line_edit.setPlaceholderText(placeholder)
         line_edit.setMaximumWidth(max_width)
+        if validator is not None:
+            line_edit.setValidator(validator)
         return line_edit
     
     @staticmethod
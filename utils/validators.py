@@ -1,4 +1,5 @@
-from typing import List
+import numpy as np
+from typing import List, Optional, Tuple
 from PyQt6.QtWidgets import QLineEdit
 
 class InputValidator:
@@ -26,6 +27,51 @@ class InputValidator:
             coefficients.append(value)
         return coefficients
     
+    @staticmethod
+    def validate_coefficients_bulk(inputs: List[QLineEdit], 
+                                   name: str = "Value",
+                                   prefix: str = "",
+                                   shape: Optional[Tuple[int, int]] = None,
+                                   non_negative: bool = False) -> np.ndarray:
+        """
+        Validate and extract coefficients from input fields in one pass.
+        Fields are parsed together and checked with vectorised masks; the
+        per-field checks only run to name the offending field once one fails.
+        Args:
+            inputs: List of QLineEdit widgets (row-major when shape is given)
+            name: Name for error messages
+            prefix: Prefix for variable names in error messages
+            shape: Reshape the values to this (rows, cols) matrix
+            non_negative: Reject negative values
+        Returns:
+            np.ndarray: Validated float64 values
+        Raises:
+            ValueError: If any input is invalid
+        """
+        def var_name(k: int) -> str:
+            if shape is not None:
+                i, j = divmod(k, shape[1])
+                return f"{name} row {i+1}, column {j+1}"
+            return f"{prefix}{k+1}" if prefix else f"{name} {k+1}"
+
+        texts = [line_edit.text().strip() for line_edit in inputs]
+        try:
+            values = np.fromiter(map(float, texts), dtype=np.float64, count=len(texts))
+        except ValueError:
+            for k, text in enumerate(texts):
+                InputValidator.validate_coefficient(text, var_name(k))
+            raise
+
+        # float() accepts 'inf' / 'nan'; one vectorised mask covers every field
+        bad = ~np.isfinite(values)
+        if non_negative:
+            bad |= values < 0
+        if bad.any():
+            k = int(bad.argmax())
+            InputValidator.validate_finite(float(values[k]), var_name(k))
+            InputValidator.validate_non_negative(float(values[k]), var_name(k))
+        return values.reshape(shape) if shape is not None else values
+    
     @staticmethod
     def validate_coefficient(text: str, var_name: str) -> float:
         """
@@ -46,6 +92,22 @@ class InputValidator:
             raise ValueError(f"{var_name}: Invalid number format '{text}'")
         return value
     
+    @staticmethod
+    def validate_finite(value: float, var_name: str) -> float:
+        """
+        Validate that value is a finite number.
+        Args:
+            value: Value to validate
+            var_name: Variable name for error messages
+        Returns:
+            Validated value
+        Raises:
+            ValueError: If value is infinite or NaN
+        """
+        if not np.isfinite(value):
+            raise ValueError(f"{var_name}: Value must be a finite number (got {value})")
+        return value
+    
     @staticmethod
     def validate_non_negative(value: float, var_name: str) -> float:
         """
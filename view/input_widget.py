@@ -1,21 +1,39 @@
+import numpy as np
+from itertools import chain
 from typing import List, Tuple
 from PyQt6.QtWidgets import (
     QGroupBox, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit, 
     QPushButton, QScrollArea, QWidget, QGridLayout
 )
+from PyQt6.QtCore import QLocale, QTimer, QSignalBlocker, pyqtSignal
+from PyQt6.QtGui import QDoubleValidator
 from utils import (
     UIHelper, InputWidgetConstants, InputValidator,
     TLPProblem
 )
 
 
+# shared style strings, one object for every label that uses them
+_SECTION_LABEL_STYLE = "color: #aaaaaa; font-style: italic;"
+_MATRIX_HEADER_STYLE = "font-weight: bold; color: #ffffff;"
+
+
 class InputSection(QGroupBox):
     """Widget for Transportation LP problem input and configuration"""
+    # emitted once by clear(), instead of a textChanged per field
+    cleared = pyqtSignal()
+    
     def __init__(self) -> None:
         super().__init__("Problem Configuration")
         self.supply_inputs: List[QLineEdit] = []
         self.demand_inputs: List[QLineEdit] = []
         self.cost_inputs: List[List[QLineEdit]] = []
+        # widgets are pooled across rebuilds: grown on demand, hidden when unused
+        self._supply_pool: List[Tuple[QLabel, QLineEdit]] = []
+        self._demand_pool: List[Tuple[QLabel, QLineEdit]] = []
+        self._cost_pool: List[List[QLineEdit]] = []
+        self._cost_row_headers: List[QLabel] = []
+        self._cost_col_headers: List[QLabel] = []
         self._init_widgets()
         self._init_ui()
     
@@ -32,6 +50,31 @@ class InputSection(QGroupBox):
             InputWidgetConstants.SPINBOX_WIDTH
         )
         self.generate_btn = QPushButton("Create Form")
+        
+        # spinbox changes rebuild the form once they settle; start() restarts a
+        # running timer, so holding an arrow key coalesces into a single rebuild
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(InputWidgetConstants.REBUILD_DELAY_MS)
+        self._rebuild_timer.timeout.connect(self._resize_form)
+        self.supply_count.valueChanged.connect(self._rebuild_timer.start)
+        self.demand_count.valueChanged.connect(self._rebuild_timer.start)
+        
+        # shared by every field: malformed text is refused while typing, so the
+        # parse on solve only has to deal with empty or unfinished entries
+        self._value_validator = self._create_validator(0.0)
+        self._cost_validator = self._create_validator(-InputWidgetConstants.MAX_INPUT_VALUE)
+    
+    def _create_validator(self, bottom: float) -> QDoubleValidator:
+        """Create a C-locale decimal validator with the given lower bound"""
+        validator = QDoubleValidator(bottom, InputWidgetConstants.MAX_INPUT_VALUE, 
+                                     InputWidgetConstants.INPUT_DECIMALS, self)
+        validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        # float() parses '.' decimals without group separators, whatever the system locale
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+        validator.setLocale(locale)
+        return validator
     
     def _init_ui(self) -> None:
         """Initialize the input section UI"""
@@ -50,22 +93,24 @@ class InputSection(QGroupBox):
         # supply section
         layout.addWidget(self._create_section_label("Supply (A):", "Available resources at suppliers"))
         
-        supply_container = QWidget()
-        supply_container.setMaximumWidth(InputWidgetConstants.MAX_SECTION_WIDTH)
-        self.supply_layout = QHBoxLayout(supply_container)
+        self.supply_container = QWidget()
+        self.supply_container.setMaximumWidth(InputWidgetConstants.MAX_SECTION_WIDTH)
+        self.supply_layout = QHBoxLayout(self.supply_container)
         self.supply_layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(supply_container)
+        self.supply_layout.addStretch()
+        layout.addWidget(self.supply_container)
         
         layout.addSpacing(15)
         
         # demand section
         layout.addWidget(self._create_section_label("Demand (B):", "Required resources at consumers"))
         
-        demand_container = QWidget()
-        demand_container.setMaximumWidth(InputWidgetConstants.MAX_SECTION_WIDTH)
-        self.demand_layout = QHBoxLayout(demand_container)
+        self.demand_container = QWidget()
+        self.demand_container.setMaximumWidth(InputWidgetConstants.MAX_SECTION_WIDTH)
+        self.demand_layout = QHBoxLayout(self.demand_container)
         self.demand_layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(demand_container)
+        self.demand_layout.addStretch()
+        layout.addWidget(self.demand_container)
         
         layout.addSpacing(15)
         
@@ -95,7 +140,7 @@ class InputSection(QGroupBox):
         """Create section label with description"""
         return UIHelper.create_label(
             f"{title} {description}",
-            style="color: #aaaaaa; font-style: italic;"
+            style=_SECTION_LABEL_STYLE
         )
     
     def _create_cost_scroll(self) -> QScrollArea:
@@ -108,104 +153,160 @@ class InputSection(QGroupBox):
         self.cost_layout.setSpacing(5)
         self.cost_layout.setContentsMargins(5, 5, 5, 5)
         
+        self.cost_grid = QGridLayout()
+        self.cost_grid.setSpacing(5)
+        self.cost_grid.addWidget(QLabel(""), 0, 0)  # corner
+        self.cost_layout.addLayout(self.cost_grid)
+        self.cost_layout.addStretch()
+        
         scroll.setWidget(self.cost_container)
         return scroll
     
     def update(self) -> None:
-        """Update input form based on selected parameters"""
+        """Update input form based on selected parameters, resetting every field"""
+        self._rebuild_form(keep_values=False)
+    
+    def _resize_form(self) -> None:
+        """Follow a spinbox change, keeping the values of fields that stay visible"""
+        self._rebuild_form(keep_values=True)
+    
+    def _rebuild_form(self, keep_values: bool) -> None:
+        """
+        Show as many fields as the spinboxes ask for.
+        Args:
+            keep_values: Keep the text of fields that were already visible;
+                newly shown fields always start empty
+        """
+        self._rebuild_timer.stop()
         supply_count = self.supply_count.value()
         demand_count = self.demand_count.value()
         
-        self._update_supply_inputs(supply_count)
-        self._update_demand_inputs(demand_count)
-        self._update_cost_matrix(supply_count, demand_count)
+        with UIHelper.frozen(self.supply_container):
+            self._update_supply_inputs(supply_count, keep_values)
+        with UIHelper.frozen(self.demand_container):
+            self._update_demand_inputs(demand_count, keep_values)
+        with UIHelper.frozen(self.cost_container):
+            self._update_cost_matrix(supply_count, demand_count, keep_values)
     
-    def _update_supply_inputs(self, count: int) -> None:
+    def _update_supply_inputs(self, count: int, keep_values: bool = False) -> None:
         """Update supply inputs"""
-        UIHelper.clear_layout(self.supply_layout)
-        self.supply_inputs.clear()
-        
-        for i in range(count):
-            label, line_edit = self._create_value_input(f"A{i+1}:")
-            self.supply_inputs.append(line_edit)
-            self.supply_layout.addWidget(label)
-            self.supply_layout.addWidget(line_edit)
-        
-        self.supply_layout.addStretch()
+        self.supply_inputs = self._update_value_inputs(
+            self.supply_layout, self._supply_pool, InputWidgetConstants.SUPPLIER_LABELS, count,
+            len(self.supply_inputs) if keep_values else 0
+        )
     
-    def _update_demand_inputs(self, count: int) -> None:
+    def _update_demand_inputs(self, count: int, keep_values: bool = False) -> None:
         """Update demand inputs"""
-        UIHelper.clear_layout(self.demand_layout)
-        self.demand_inputs.clear()
-        
-        for i in range(count):
-            label, line_edit = self._create_value_input(f"B{i+1}:")
-            self.demand_inputs.append(line_edit)
-            self.demand_layout.addWidget(label)
-            self.demand_layout.addWidget(line_edit)
+        self.demand_inputs = self._update_value_inputs(
+            self.demand_layout, self._demand_pool, InputWidgetConstants.CONSUMER_LABELS, count,
+            len(self.demand_inputs) if keep_values else 0
+        )
+    
+    def _update_value_inputs(self, layout: QHBoxLayout, pool: List[Tuple[QLabel, QLineEdit]],
+                             names: Tuple[str, ...], count: int, kept: int = 0) -> List[QLineEdit]:
+        """
+        Show the first count pooled inputs of a row layout, creating only the missing ones.
+        Args:
+            layout: Row layout ending with a stretch
+            pool: All (label, line_edit) pairs created so far for this layout
+            names: Precomputed input names ("A1", "A2", ... or "B1", ...)
+            count: Number of inputs to show
+            kept: Number of leading inputs whose text is kept, the others are cleared
+        Returns:
+            List[QLineEdit]: The visible inputs, in order
+        """
+        for i in range(len(pool), count):
+            label, line_edit = self._create_value_input(names[i] + ":")
+            layout.insertWidget(layout.count() - 1, label)
+            layout.insertWidget(layout.count() - 1, line_edit)
+            pool.append((label, line_edit))
         
-        self.demand_layout.addStretch()
+        for i, (label, line_edit) in enumerate(pool):
+            visible = i < count
+            label.setVisible(visible)
+            line_edit.setVisible(visible)
+            if visible and i >= kept:
+                line_edit.clear()
+        return [line_edit for _, line_edit in pool[:count]]
     
     def _create_value_input(self, label_text: str) -> Tuple[QLabel, QLineEdit]:
         """Factory method for creating value inputs"""
         label = UIHelper.create_label(label_text, InputWidgetConstants.LABEL_WIDTH)
-        line_edit = UIHelper.create_numeric_input("0", InputWidgetConstants.VALUE_INPUT_WIDTH)
+        line_edit = UIHelper.create_numeric_input(
+            "0", InputWidgetConstants.VALUE_INPUT_WIDTH, self._value_validator
+        )
         return label, line_edit
     
-    def _update_cost_matrix(self, supply_count: int, demand_count: int) -> None:
-        """Update cost matrix grid"""
-        UIHelper.clear_layout(self.cost_layout)
-        self.cost_inputs.clear()
-        grid = QGridLayout()
-        grid.setSpacing(5)
+    def _update_cost_matrix(self, supply_count: int, demand_count: int, 
+                            keep_values: bool = False) -> None:
+        """Update cost matrix grid, reusing the pooled headers and inputs"""
+        grid = self.cost_grid
+        # block of previously visible cells whose text is kept
+        kept_rows = len(self.cost_inputs) if keep_values else 0
+        kept_cols = len(self.cost_inputs[0]) if kept_rows else 0
         
         # header row (consumers)
-        grid.addWidget(QLabel(""), 0, 0)  # corner
-        for j in range(demand_count):
-            header = UIHelper.create_label(f"B{j+1}", InputWidgetConstants.MATRIX_HEADER_WIDTH)
-            header.setStyleSheet("font-weight: bold; color: #ffffff;")
+        for j in range(len(self._cost_col_headers), demand_count):
+            header = self._create_matrix_header(InputWidgetConstants.CONSUMER_LABELS[j])
             grid.addWidget(header, 0, j + 1)
+            self._cost_col_headers.append(header)
         
-        # data rows
-        for i in range(supply_count):
-            # suppliers
-            row_header = UIHelper.create_label(f"A{i+1}", InputWidgetConstants.MATRIX_HEADER_WIDTH)
-            row_header.setStyleSheet("font-weight: bold; color: #ffffff;")
+        # suppliers
+        for i in range(len(self._cost_row_headers), supply_count):
+            row_header = self._create_matrix_header(InputWidgetConstants.SUPPLIER_LABELS[i])
             grid.addWidget(row_header, i + 1, 0)
-            
-            # cost
-            row_inputs = []
-            for j in range(demand_count):
-                cost_input = UIHelper.create_numeric_input("0", InputWidgetConstants.COST_INPUT_WIDTH)
-                row_inputs.append(cost_input)
+            self._cost_row_headers.append(row_header)
+            self._cost_pool.append([])
+        
+        # cost
+        for i, row_inputs in enumerate(self._cost_pool[:supply_count]):
+            for j in range(len(row_inputs), demand_count):
+                cost_input = UIHelper.create_numeric_input(
+                    "0", InputWidgetConstants.COST_INPUT_WIDTH, self._cost_validator
+                )
                 grid.addWidget(cost_input, i + 1, j + 1)
-            
-            self.cost_inputs.append(row_inputs)
-
-        grid_widget = QWidget()
-        grid_widget.setLayout(grid)
-        self.cost_layout.addWidget(grid_widget)
-        self.cost_layout.addStretch()
+                row_inputs.append(cost_input)
+        
+        for j, header in enumerate(self._cost_col_headers):
+            header.setVisible(j < demand_count)
+        for i, (row_header, row_inputs) in enumerate(zip(self._cost_row_headers, self._cost_pool)):
+            row_header.setVisible(i < supply_count)
+            for j, cost_input in enumerate(row_inputs):
+                visible = i < supply_count and j < demand_count
+                cost_input.setVisible(visible)
+                if visible and (i >= kept_rows or j >= kept_cols):
+                    cost_input.clear()
+        
+        self.cost_inputs = [row_inputs[:demand_count] for row_inputs in self._cost_pool[:supply_count]]
+    
+    @staticmethod
+    def _create_matrix_header(text: str) -> QLabel:
+        """Create cost matrix header label"""
+        header = UIHelper.create_label(text, InputWidgetConstants.MATRIX_HEADER_WIDTH)
+        header.setStyleSheet(_MATRIX_HEADER_STYLE)
+        return header
     
     def get_data(self) -> Tuple[TLPProblem, bool, str]:
         """
         Extract and validate input data.
         Returns:
             TLPProblem: Dataclass containing:
-                - supply (List[float]): Supply values at each supplier
-                - demand (List[float]): Demand values at each consumer
-                - costs (List[List[float]]): Cost matrix (m x n)
+                - supply (np.ndarray): Supply values at each supplier
+                - demand (np.ndarray): Demand values at each consumer
+                - costs (np.ndarray): Cost matrix (m x n)
             bool: True if extraction and validation succeeded, otherwise False
             str: Error message if validation failed, empty string otherwise
         """
         try:
-            supply = InputValidator.validate_coefficients(
+            supply = InputValidator.validate_coefficients_bulk(
                 self.supply_inputs,
-                name="Supply"
+                name="Supply",
+                non_negative=True
             )
-            demand = InputValidator.validate_coefficients(
+            demand = InputValidator.validate_coefficients_bulk(
                 self.demand_inputs,
-                name="Demand"
+                name="Demand",
+                non_negative=True
             )
             costs = self._parse_cost_matrix()
             return TLPProblem(
@@ -216,28 +317,21 @@ class InputSection(QGroupBox):
         except ValueError as e:
             return None, False, str(e)
     
-    def _parse_cost_matrix(self) -> List[List[float]]:
+    def _parse_cost_matrix(self) -> np.ndarray:
         """Parse and validate cost matrix"""
-        costs = []
-        for i, row in enumerate(self.cost_inputs):
-            try:
-                row_costs = InputValidator.validate_coefficients(
-                    row,
-                    name=f"Cost matrix row {i+1}"
-                )
-                costs.append(row_costs)
-            except ValueError as e:
-                raise ValueError(f"Cost matrix row {i+1}: {str(e)}")
-        return costs
+        rows = len(self.cost_inputs)
+        cols = len(self.cost_inputs[0]) if rows else 0
+        return InputValidator.validate_coefficients_bulk(
+            [line_edit for row in self.cost_inputs for line_edit in row],
+            name="Cost matrix",
+            shape=(rows, cols)
+        )
     
     def clear(self) -> None:
         """Clear all input fields"""
-        for line_edit in self.supply_inputs:
-            line_edit.clear()
-        
-        for line_edit in self.demand_inputs:
-            line_edit.clear()
-        
-        for row in self.cost_inputs:
-            for line_edit in row:
-                line_edit.clear()
\ No newline at end of file
+        for line_edit in chain(self.supply_inputs, self.demand_inputs, *self.cost_inputs):
+            # QSignalBlocker only silences its own object, so one per field;
+            # the with block restores the signals even if clear() raises
+            with QSignalBlocker(line_edit):
+                line_edit.clear()
+        self.cleared.emit()
\ No newline at end of file
@@ -1,17 +1,213 @@
-from typing import List
+import hashlib
+import struct
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QGroupBox, QVBoxLayout, QLabel,
-    QScrollArea, QWidget, QGridLayout, QTextEdit
+    QTableView, QHeaderView, QAbstractItemView, QTextEdit
 )
-from PyQt6.QtCore import Qt
-from utils import UIHelper, ResultWidgetConstants, ResultFormatter, TLPResult
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from PyQt6.QtGui import QBrush, QColor, QFont
+from utils import (
+    UIHelper, InputWidgetConstants, ResultWidgetConstants, ResultFormatter, TLPResult,
+    SolutionStatus, StatusColor
+)
+
+
+# one stylesheet for the whole section; the status label picks its look through
+# the statusKind dynamic property, so no per-widget QSS is parsed
+_RESULT_STYLE = """
+    QLabel#statusLabel {
+        font-size: 14pt; font-weight: bold; padding: 10px;
+        background-color: #3a3a3a; border-radius: 5px;
+    }
+    QLabel#optimalValueLabel {
+        font-size: 13pt; padding: 8px;
+        background-color: #2d2d2d; border-radius: 5px;
+    }
+    QTableView#allocationTable {
+        gridline-color: #555555;
+    }
+    QTableView#allocationTable QHeaderView::section {
+        background-color: #404040; font-weight: bold;
+        border: 1px solid #555555;
+    }
+""" + "".join(
+    f'    QLabel#statusLabel[statusKind="{status.value}"] '
+    f'{{ background-color: {StatusColor.get_color(status)}; color: #ffffff; }}\n'
+    for status in SolutionStatus
+)
+
+_SECTION_LABEL_STYLE = "font-size: 11pt; font-weight: bold; color: #ffffff;"
+_SUMMARY_STYLE = (
+    "background-color: #2d2d2d; border: 1px solid #555555; "
+    "border-radius: 5px; padding: 5px; font-family: monospace;"
+)
+
+
+def _header_labels(cached: tuple, prefix: str, count: int) -> tuple:
+    """First count header names, formatting only those beyond the precomputed ones"""
+    if count <= len(cached):
+        return cached[:count]
+    return cached + tuple(f"{prefix}{k+1}" for k in range(len(cached), count))
+
+
+class AllocationTableModel(QAbstractTableModel):
+    """
+    Read-only table model over an allocation matrix (m x n), extended with a
+    Supply column of row sums and a Demand row of column sums.
+    The view asks only for the cells it paints, so no widget exists per cell.
+    Only the non-zero allocations (at most m+n-1 for a basic solution) are
+    stored; every other cell is drawn from the shared zero text and style.
+    """
+    # cell kinds, index into the brush/font lookups
+    ZERO, ACTIVE, SUM, CORNER = range(4)
+    ZERO_TEXT = ResultFormatter.format_allocation_value(0.0)
+    
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._num_suppliers = 0
+        self._num_consumers = 0
+        self._active: Dict[Tuple[int, int], str] = {}   # (i, j) -> text of non-zero cells
+        self._row_sums: List[str] = []
+        self._col_sums: List[str] = []
+        self._row_headers: tuple = ()
+        self._col_headers: tuple = ()
+        
+        bold = QFont()
+        bold.setBold(True)
+        self._backgrounds = (
+            QBrush(QColor("#2d2d2d")), QBrush(QColor("#2d5a2d")),
+            QBrush(QColor("#3a4a5a")), QBrush(QColor("#404040"))
+        )
+        self._foregrounds = (
+            QBrush(QColor("#888888")), QBrush(QColor("#ffffff")),
+            QBrush(QColor("#ffffff")), QBrush(QColor("#ffffff"))
+        )
+        self._fonts = (None, bold, bold, bold)
+    
+    def set_array(self, solution: Any) -> None:
+        """
+        Replace the displayed allocation.
+        Args:
+            solution: Allocation matrix of shape (m, n), list of lists or np.ndarray
+        """
+        arr = np.asarray(solution, dtype=np.float64)
+        self.beginResetModel()
+        if arr.ndim != 2 or arr.size == 0:
+            self._num_suppliers = self._num_consumers = 0
+            self._active, self._row_sums, self._col_sums = {}, [], []
+            self._row_headers = self._col_headers = ()
+        else:
+            m, n = arr.shape
+            rows, cols = np.nonzero(arr > 1e-6)
+            # formatted in vectorised calls, data() only looks texts up
+            texts = ResultFormatter.format_allocation_matrix(arr[rows, cols]).tolist()
+            self._active = dict(zip(zip(rows.tolist(), cols.tolist()), texts))
+            self._row_sums = ResultFormatter.format_allocation_matrix(arr.sum(axis=1)).tolist()
+            self._col_sums = ResultFormatter.format_allocation_matrix(arr.sum(axis=0)).tolist()
+            self._num_suppliers, self._num_consumers = m, n
+            self._row_headers = _header_labels(InputWidgetConstants.SUPPLIER_LABELS, "A", m) + ("Demand",)
+            self._col_headers = _header_labels(InputWidgetConstants.CONSUMER_LABELS, "B", n) + ("Supply",)
+        self.endResetModel()
+    
+    def clear(self) -> None:
+        """Remove all rows and columns"""
+        self.set_array(np.empty((0, 0)))
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of suppliers plus the Demand row"""
+        return self._num_suppliers + 1 if self._num_suppliers else 0
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of consumers plus the Supply column"""
+        return self._num_consumers + 1 if self._num_consumers else 0
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Cells are display-only"""
+        return Qt.ItemFlag.ItemIsEnabled
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Text and look of one cell"""
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        text, kind = self._cell(index.row(), index.column())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return text
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._backgrounds[kind]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foregrounds[kind]
+        if role == Qt.ItemDataRole.FontRole:
+            return self._fonts[kind]
+        return None
+    
+    def _cell(self, i: int, j: int) -> Tuple[str, int]:
+        """(text, kind) of cell (i, j), the last row / column holding the sums"""
+        if i < self._num_suppliers:
+            if j < self._num_consumers:
+                text = self._active.get((i, j))
+                return (self.ZERO_TEXT, self.ZERO) if text is None else (text, self.ACTIVE)
+            return self._row_sums[i], self.SUM
+        if j < self._num_consumers:
+            return self._col_sums[j], self.SUM
+        return "", self.CORNER
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, 
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Supplier / consumer labels, plus Demand / Supply for the sums"""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._col_headers[section]
+        return self._row_headers[section]
+
+
+class _SummarySignals(QObject):
+    """Signals of _SummaryTask (QRunnable is not a QObject)"""
+    finished = pyqtSignal(int, str)  # (request sequence number, summary text)
+
+
+class _SummaryTask(QRunnable):
+    """Formats a solution summary on a QThreadPool worker thread"""
+    def __init__(self, seq: int, result: TLPResult, signals: _SummarySignals) -> None:
+        """
+        Args:
+            seq: Sequence number identifying this request
+            result: TLPResult to summarise, not modified
+            signals: GUI-thread object to report through (queued across threads)
+        """
+        super().__init__()
+        self.seq = seq
+        self.result = result
+        self.signals = signals
+    
+    def run(self) -> None:
+        """Format the summary and report it with its sequence number"""
+        summary = ResultFormatter.format_summary(self.result)
+        try:
+            self.signals.finished.emit(self.seq, summary)
+        except RuntimeError:
+            # the ResultSection (and its signals object) was destroyed meanwhile
+            pass
 
 
 class ResultSection(QGroupBox):
     """Widget for displaying Transportation LP optimization results"""
     def __init__(self) -> None:
         super().__init__("Results")
+        self.setStyleSheet(_RESULT_STYLE)
+        self._last_result_key: Optional[bytes] = None
+        # summaries are formatted off the GUI thread; only the latest request is shown.
+        # the signals object is owned by this section, workers guard against its deletion
+        self._summary_seq = 0
+        self._summary_signals = _SummarySignals(self)
         self._init_ui()
+        self._summary_signals.finished.connect(self._on_summary_ready)
     
     def _init_ui(self) -> None:
         """Initialize the results section UI"""
@@ -30,8 +226,9 @@ class ResultSection(QGroupBox):
         
         # allocation matrix section
         layout.addWidget(self._create_section_label("Allocation Matrix (X):"))
-        self.allocation_scroll = self._create_allocation_scroll()
-        layout.addWidget(self.allocation_scroll)
+        self.allocation_model = AllocationTableModel(self)
+        self.allocation_table = self._create_allocation_table()
+        layout.addWidget(self.allocation_table)
         
         layout.addSpacing(10)
         
@@ -45,20 +242,14 @@ class ResultSection(QGroupBox):
     def _create_status_label(self) -> QLabel:
         """Create status label"""
         label = QLabel("No results yet")
-        label.setStyleSheet(
-            "font-size: 14pt; font-weight: bold; padding: 10px; "
-            "background-color: #3a3a3a; border-radius: 5px;"
-        )
+        label.setObjectName("statusLabel")
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         return label
     
     def _create_optimal_value_label(self) -> QLabel:
         """Create optimal value label"""
         label = QLabel("")
-        label.setStyleSheet(
-            "font-size: 13pt; padding: 8px; "
-            "background-color: #2d2d2d; border-radius: 5px;"
-        )
+        label.setObjectName("optimalValueLabel")
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         return label
     
@@ -67,32 +258,29 @@ class ResultSection(QGroupBox):
         """Create section label"""
         return UIHelper.create_label(
             text,
-            style="font-size: 11pt; font-weight: bold; color: #ffffff;"
+            style=_SECTION_LABEL_STYLE
         )
     
-    def _create_allocation_scroll(self) -> QScrollArea:
-        """Create scrollable allocation matrix area"""
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setMinimumHeight(ResultWidgetConstants.MIN_MATRIX_HEIGHT)
-        
-        self.allocation_container = QWidget()
-        self.allocation_layout = QVBoxLayout(self.allocation_container)
-        self.allocation_layout.setSpacing(5)
-        self.allocation_layout.setContentsMargins(5, 5, 5, 5)
-        
-        scroll.setWidget(self.allocation_container)
-        return scroll
+    def _create_allocation_table(self) -> QTableView:
+        """Create allocation matrix view"""
+        table = QTableView()
+        table.setObjectName("allocationTable")
+        table.setModel(self.allocation_model)
+        table.setMinimumHeight(ResultWidgetConstants.MIN_MATRIX_HEIGHT)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        for header in (table.horizontalHeader(), table.verticalHeader()):
+            header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+            header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
+        table.horizontalHeader().setMinimumSectionSize(60)
+        return table
     
     def _create_summary_text(self) -> QTextEdit:
         """Create summary text area"""
         text_edit = QTextEdit()
         text_edit.setReadOnly(True)
         text_edit.setMaximumHeight(ResultWidgetConstants.SUMMARY_HEIGHT)
-        text_edit.setStyleSheet(
-            "background-color: #2d2d2d; border: 1px solid #555555; "
-            "border-radius: 5px; padding: 5px; font-family: monospace;"
-        )
+        text_edit.setStyleSheet(_SUMMARY_STYLE)
         return text_edit
     
     def display_results(self, result: TLPResult) -> None:
@@ -102,6 +290,12 @@ class ResultSection(QGroupBox):
         Args:
             result: TLPResult object containing solution data
         """
+        # identical result to the one on screen: nothing to redraw
+        key = self._result_key(result)
+        if key == self._last_result_key:
+            return
+        self._last_result_key = key
+        
         self._update_status(result)
         self._update_optimal_value(result)
         
@@ -112,14 +306,37 @@ class ResultSection(QGroupBox):
             self._clear_allocation_matrix()
             self._display_error_summary(result)
     
+    @staticmethod
+    def _result_key(result: TLPResult) -> bytes:
+        """
+        Content hash of everything display_results renders.
+        Args:
+            result: TLPResult object
+        Returns:
+            bytes: 16-byte blake2b digest
+        """
+        key = hashlib.blake2b(digest_size=16)
+        if result.solution is not None:
+            solution = np.ascontiguousarray(result.solution, dtype=np.float64)
+            key.update(struct.pack("<q", solution.ndim) + struct.pack(f"<{solution.ndim}q", *solution.shape))
+            key.update(solution.tobytes())
+        key.update(str.__str__(result.status).encode())
+        key.update(struct.pack("<?d", result.optimal_value is not None, result.optimal_value or 0.0))
+        key.update((result.error_message or "").encode())
+        return key.digest()
+    
     def _update_status(self, result: TLPResult) -> None:
         """Update status label"""
-        status_text, status_color = ResultFormatter.format_status(result.status)
+        status_text, _ = ResultFormatter.format_status(result.status)
         self.status_label.setText(f"Status: {status_text}")
-        self.status_label.setStyleSheet(
-            f"font-size: 14pt; font-weight: bold; padding: 10px; "
-            f"background-color: {status_color}; border-radius: 5px; color: #ffffff;"
-        )
+        self._set_status_kind(ResultFormatter.resolve_status(result.status).value)
+    
+    def _set_status_kind(self, kind: str) -> None:
+        """Switch the status label style through its statusKind property"""
+        self.status_label.setProperty("statusKind", kind)
+        style = self.status_label.style()
+        style.unpolish(self.status_label)
+        style.polish(self.status_label)
     
     def _update_optimal_value(self, result: TLPResult) -> None:
         """Update optimal value label"""
@@ -132,103 +349,24 @@ class ResultSection(QGroupBox):
     
     def _display_allocation_matrix(self, solution: List[List[float]]) -> None:
         """Display allocation matrix"""
-        UIHelper.clear_layout(self.allocation_layout)
-        if not solution: 
-            return
-        num_suppliers = len(solution)
-        num_consumers = len(solution[0]) if solution else 0
-        
-        grid = QGridLayout()
-        grid.setSpacing(3)
-        
-        # header (consumers)
-        grid.addWidget(self._create_header_label(""), 0, 0)
-        for j in range(num_consumers):
-            header = self._create_header_label(f"B{j+1}")
-            grid.addWidget(header, 0, j + 1)
-        # supply column header
-        grid.addWidget(self._create_header_label("Supply"), 0, num_consumers + 1)
-        
-        for i in range(num_suppliers):
-            # row header (suppliers)
-            row_header = self._create_header_label(f"A{i+1}")
-            grid.addWidget(row_header, i + 1, 0)
-            
-            # allocation values
-            row_sum = 0
-            for j in range(num_consumers):
-                value = solution[i][j]
-                row_sum += value
-                cell = self._create_cell_label(value)
-                grid.addWidget(cell, i + 1, j + 1)
-            
-            # supply used
-            sum_label = self._create_sum_label(row_sum)
-            grid.addWidget(sum_label, i + 1, num_consumers + 1)
-        
-        # demand
-        grid.addWidget(self._create_header_label("Demand"), num_suppliers + 1, 0)
-        for j in range(num_consumers):
-            col_sum = sum(solution[i][j] for i in range(num_suppliers))
-            sum_label = self._create_sum_label(col_sum)
-            grid.addWidget(sum_label, num_suppliers + 1, j + 1)
-        
-        grid_widget = QWidget()
-        grid_widget.setLayout(grid)
-        self.allocation_layout.addWidget(grid_widget)
-        self.allocation_layout.addStretch()
-    
-    def _create_header_label(self, text: str) -> QLabel:
-        """Create header label for matrix"""
-        label = QLabel(text)
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet(
-            "font-weight: bold; color: #ffffff; "
-            "background-color: #404040; padding: 5px; "
-            "border: 1px solid #555555; min-width: 60px;"
-        )
-        return label
-    
-    def _create_cell_label(self, value: float) -> QLabel:
-        """Create cell label for allocation value"""
-        text = ResultFormatter.format_allocation_value(value)
-        label = QLabel(text)
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        if value > 1e-6:
-            style = (
-                "background-color: #2d5a2d; color: #ffffff; "
-                "padding: 5px; border: 1px solid #555555; "
-                "min-width: 60px; font-weight: bold;"
-            )
-        else:
-            style = (
-                "background-color: #2d2d2d; color: #888888; "
-                "padding: 5px; border: 1px solid #555555; min-width: 60px;"
-            )
-        
-        label.setStyleSheet(style)
-        return label
-    
-    def _create_sum_label(self, value: float) -> QLabel:
-        """Create sum label"""
-        text = ResultFormatter.format_allocation_value(value)
-        label = QLabel(text)
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet(
-            "background-color: #3a4a5a; color: #ffffff; "
-            "padding: 5px; border: 1px solid #555555; "
-            "min-width: 60px; font-weight: bold;"
-        )
-        return label
+        self.allocation_model.set_array(solution)
     
     def _display_summary(self, result: TLPResult) -> None:
-        """Display solution summary"""
-        summary = ResultFormatter.format_summary(result)
-        self.summary_text.setPlainText(summary)
+        """Display solution summary, formatted on a worker thread"""
+        self._summary_seq += 1
+        # don't leave the previous result's summary up while this one is formatted
+        self.summary_text.setPlainText(ResultWidgetConstants.SUMMARY_PLACEHOLDER)
+        task = _SummaryTask(self._summary_seq, result, self._summary_signals)
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_summary_ready(self, seq: int, summary: str) -> None:
+        """Show a finished summary unless a newer display has superseded it"""
+        if seq == self._summary_seq:
+            self.summary_text.setPlainText(summary)
     
     def _display_error_summary(self, result: TLPResult) -> None:
         """Display error summary"""
+        self._summary_seq += 1  # drop any summary still being formatted
         if result.error_message:
             self.summary_text.setPlainText(f"Error: {result.error_message}")
         else:
@@ -236,15 +374,14 @@ class ResultSection(QGroupBox):
     
     def _clear_allocation_matrix(self) -> None:
         """Clear allocation matrix display"""
-        UIHelper.clear_layout(self.allocation_layout)
+        self.allocation_model.clear()
     
     def clear(self) -> None:
         """Clear all results"""
+        self._last_result_key = None
         self.status_label.setText("No results yet")
-        self.status_label.setStyleSheet(
-            "font-size: 14pt; font-weight: bold; padding: 10px; "
-            "background-color: #3a3a3a; border-radius: 5px;"
-        )
+        self._set_status_kind("")
         self.optimal_value_label.hide()
         self._clear_allocation_matrix()
+        self._summary_seq += 1
         self.summary_text.clear()
\ No newline at end of file